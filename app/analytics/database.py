@@ -2,18 +2,133 @@
 SQLite database schema and operations for analytics
 """
 
+import atexit
 import sqlite3
 import os
-from datetime import datetime
+import glob
+import queue
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional, List, Dict, Any
 from app.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Timestamps are produced by SQLite rather than bound from Python. Local time
+# with fractional seconds, matching the format of rows written by earlier
+# versions through the datetime adapter, so range comparisons keep working.
+_SQL_NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now', 'localtime')"
+
+# Row types for queries that can return many rows; built straight from the
+# result tuples instead of going through sqlite3.Row and a dict per row
+SessionSummary = namedtuple(
+    "SessionSummary",
+    "id start_time end_time stream_title total_messages total_commands peak_viewers"
+)
+ViewerSession = namedtuple(
+    "ViewerSession",
+    "id start_time stream_title game message_count"
+)
+
+
+def _tuple_rows(row_type):
+    """Build a cursor row_factory that produces row_type instances"""
+    make = row_type._make
+    return lambda cursor, row: make(row)
+
 
 class AnalyticsDatabase:
     """Manages SQLite database for analytics data"""
-    
+
+    # Applied once per connection, right after connecting
+    _CONNECTION_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA cache_size=-20000",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA foreign_keys=ON",
+    )
+
+    # Read-only connections skip the journal/sync settings owned by the writer
+    _READER_PRAGMAS = (
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA cache_size=-20000",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA query_only=ON",
+    )
+
+    # Number of read-only connections kept in the pool
+    READER_POOL_SIZE = 4
+
+    # Per-session report queries, shared by the single getters and
+    # get_session_report()
+    _SQL_SESSION_STATS = "SELECT * FROM sessions WHERE id = ?"
+    _SQL_TOP_CHATTERS = """
+        SELECT author, COUNT(*) as message_count
+        FROM messages
+        WHERE session_id = ?
+        GROUP BY author
+        ORDER BY message_count DESC
+        LIMIT ?
+    """
+    _SQL_COMMAND_STATS = """
+        SELECT command_name, execution_count, success_count,
+               failure_count, avg_response_time
+        FROM command_stats
+        WHERE session_id = ?
+        ORDER BY execution_count DESC
+    """
+
+    # Per-day leaderboard served from the daily_chatter_counts rollup, so it
+    # reads at most one day's authors instead of re-aggregating messages
+    _SQL_TOP_CHATTERS_ON_DATE = """
+        SELECT author, message_count
+        FROM daily_chatter_counts
+        WHERE date = ?
+        ORDER BY message_count DESC
+        LIMIT ?
+    """
+
+    # Hot-path statements kept as constants so every call hits the same
+    # entry in the connection's prepared-statement cache
+    _SQL_INSERT_MESSAGE = f"""
+        INSERT OR IGNORE INTO messages
+        (session_id, message_id, author, author_channel_id, message_text,
+         is_command, command_name, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, {_SQL_NOW})
+    """
+    _SQL_INSERT_VIEWER_SNAPSHOT = f"""
+        INSERT INTO viewer_snapshots
+        (session_id, viewer_count, likes, timestamp)
+        VALUES (?, ?, ?, {_SQL_NOW})
+    """
+    _SQL_UPDATE_PEAK_VIEWERS = """
+        UPDATE sessions
+        SET peak_viewers = MAX(peak_viewers, ?)
+        WHERE id = ?
+    """
+    # On conflict execution_count still holds the pre-update value, so the
+    # running average stays correct
+    _SQL_UPSERT_COMMAND_STATS = """
+        INSERT INTO command_stats
+        (session_id, command_name, execution_count, success_count,
+         failure_count, avg_response_time)
+        VALUES (?, ?, 1, ?, ?, ?)
+        ON CONFLICT(session_id, command_name) DO UPDATE SET
+            execution_count = execution_count + 1,
+            success_count = success_count + excluded.success_count,
+            failure_count = failure_count + excluded.failure_count,
+            avg_response_time = ((avg_response_time * execution_count)
+                                 + excluded.avg_response_time)
+                                / (execution_count + 1)
+    """
+
     def __init__(self, db_path: str = "data/analytics.db"):
         """
         Initialize analytics database
@@ -21,25 +136,58 @@ class AnalyticsDatabase:
         Args:
             db_path: Path to SQLite database file
         """
-        # Ensure data directory exists
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-        
         self.db_path = db_path
-        self.connection: Optional[sqlite3.Connection] = None
-        self._init_database()
+        # WAL allows one writer alongside many readers, so writes share a
+        # single locked connection while SELECTs check out a pooled reader
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.Lock()
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        
+        # Connections and schema are set up on first use, not at construction
+        self._opened = False
+        self._open_lock = threading.Lock()
+        # Closing checkpoints the WAL into the main file, so do it on every
+        # exit path, not only after a clean shutdown
+        atexit.register(self.close)
+    
+    def _ensure_open(self):
+        """Create the data directory, schema and connections on first use"""
+        if self._opened:
+            return
+        with self._open_lock:
+            if self._opened:
+                return
+            # Ensure data directory exists
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            self._init_database()
+            self._open_readers()
+            self._opened = True
     
     def _init_database(self):
         """Initialize database tables"""
         try:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.row_factory = sqlite3.Row
-            cursor = self.connection.cursor()
-            
+            # Autocommit mode: write transactions are opened explicitly
+            # with BEGIN IMMEDIATE in _write_transaction()
+            self._writer = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None
+            )
+            self._writer.row_factory = sqlite3.Row
+            cursor = self._writer.cursor()
+
+            # Connection tuning for a write-heavy chat log: WAL lets readers run
+            # alongside the writer and NORMAL sync skips the per-commit fsync
+            for pragma in self._CONNECTION_PRAGMAS:
+                cursor.execute(pragma)
+
+            cursor.execute("BEGIN IMMEDIATE")
+
             # Sessions table - tracks bot sessions
-            cursor.execute("""
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS sessions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    start_time TIMESTAMP NOT NULL,
+                    start_time TIMESTAMP NOT NULL DEFAULT ({_SQL_NOW}),
                     end_time TIMESTAMP,
                     video_id TEXT,
                     stream_title TEXT,
@@ -52,7 +200,7 @@ class AnalyticsDatabase:
             """)
             
             # Messages table - tracks all chat messages
-            cursor.execute("""
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS messages (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     session_id INTEGER NOT NULL,
@@ -60,19 +208,29 @@ class AnalyticsDatabase:
                     author TEXT NOT NULL,
                     author_channel_id TEXT,
                     message_text TEXT,
-                    timestamp TIMESTAMP NOT NULL,
+                    timestamp TIMESTAMP NOT NULL DEFAULT ({_SQL_NOW}),
                     is_command BOOLEAN DEFAULT 0,
                     command_name TEXT,
                     FOREIGN KEY (session_id) REFERENCES sessions(id)
                 )
             """)
             
-            # Viewer snapshots - periodic viewer count tracking
+            # Archived authors - last chat time of viewers whose messages
+            # archive_old_messages() moved out, so per-viewer lookups still
+            # know them
             cursor.execute("""
+                CREATE TABLE IF NOT EXISTS archived_authors (
+                    author TEXT PRIMARY KEY,
+                    last_chat TIMESTAMP NOT NULL
+                )
+            """)
+            
+            # Viewer snapshots - periodic viewer count tracking
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS viewer_snapshots (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     session_id INTEGER NOT NULL,
-                    timestamp TIMESTAMP NOT NULL,
+                    timestamp TIMESTAMP NOT NULL DEFAULT ({_SQL_NOW}),
                     viewer_count INTEGER NOT NULL,
                     likes INTEGER DEFAULT 0,
                     FOREIGN KEY (session_id) REFERENCES sessions(id)
@@ -95,11 +253,11 @@ class AnalyticsDatabase:
             """)
             
             # Bot metrics - performance tracking
-            cursor.execute("""
+            cursor.execute(f"""
                 CREATE TABLE IF NOT EXISTS bot_metrics (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     session_id INTEGER NOT NULL,
-                    timestamp TIMESTAMP NOT NULL,
+                    timestamp TIMESTAMP NOT NULL DEFAULT ({_SQL_NOW}),
                     messages_processed INTEGER DEFAULT 0,
                     commands_executed INTEGER DEFAULT 0,
                     avg_response_time REAL DEFAULT 0,
@@ -109,26 +267,175 @@ class AnalyticsDatabase:
             """)
             
             # Create indexes for better query performance
+            # (session_id, author) serves per-session GROUP BY author scans;
+            # (author, session_id) and (author, timestamp) serve the per-viewer
+            # lookups. They supersede the old single-column indexes.
+            cursor.execute("DROP INDEX IF EXISTS idx_messages_session")
+            cursor.execute("DROP INDEX IF EXISTS idx_messages_author")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_messages_session_author 
+                ON messages(session_id, author)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_messages_author_session 
+                ON messages(author, session_id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_messages_author_ts 
+                ON messages(author, timestamp DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_sessions_start_time 
+                ON sessions(start_time)
+            """)
+            # Partial indexes only cover the narrow subsets they're queried
+            # by (is_active = 1 / is_command = 1), so they stay tiny and cost
+            # nothing on plain chat inserts
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_messages_session 
-                ON messages(session_id)
+                CREATE INDEX IF NOT EXISTS idx_sessions_active 
+                ON sessions(id) WHERE is_active = 1
             """)
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_messages_author 
-                ON messages(author)
+                CREATE INDEX IF NOT EXISTS idx_messages_cmd 
+                ON messages(command_name, session_id) WHERE is_command = 1
             """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_viewer_snapshots_session 
                 ON viewer_snapshots(session_id)
             """)
             
-            self.connection.commit()
+            # Session counters are maintained inside the writing transaction
+            # so the hot path doesn't issue a second UPDATE per insert
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_messages_count
+                AFTER INSERT ON messages
+                BEGIN
+                    UPDATE sessions SET total_messages = total_messages + 1
+                    WHERE id = NEW.session_id;
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_command_stats_insert
+                AFTER INSERT ON command_stats
+                BEGIN
+                    UPDATE sessions SET total_commands = total_commands + NEW.execution_count
+                    WHERE id = NEW.session_id;
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_command_stats_update
+                AFTER UPDATE OF execution_count ON command_stats
+                BEGIN
+                    UPDATE sessions
+                    SET total_commands = total_commands + NEW.execution_count - OLD.execution_count
+                    WHERE id = NEW.session_id;
+                END
+            """)
+            
+            # Daily rollup of messages per author, keyed by the date the
+            # session started (same bucketing the per-date leaderboards used)
+            rollup_exists = cursor.execute("""
+                SELECT 1 FROM sqlite_master
+                WHERE type = 'table' AND name = 'daily_chatter_counts'
+            """).fetchone()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS daily_chatter_counts (
+                    date TEXT NOT NULL,
+                    author TEXT NOT NULL,
+                    message_count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (date, author)
+                ) WITHOUT ROWID
+            """)
+            if not rollup_exists:
+                # Backfill from existing history the first time the table is created
+                cursor.execute("""
+                    INSERT INTO daily_chatter_counts (date, author, message_count)
+                    SELECT DATE(s.start_time), m.author, COUNT(*)
+                    FROM messages m
+                    JOIN sessions s ON m.session_id = s.id
+                    GROUP BY DATE(s.start_time), m.author
+                """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_daily_chatter_counts
+                AFTER INSERT ON messages
+                BEGIN
+                    INSERT INTO daily_chatter_counts (date, author, message_count)
+                    SELECT DATE(start_time), NEW.author, 1
+                    FROM sessions WHERE id = NEW.session_id
+                    ON CONFLICT(date, author)
+                    DO UPDATE SET message_count = message_count + 1;
+                END
+            """)
+            
+            cursor.execute("COMMIT")
+
+            # Refresh planner statistics cheaply; analysis_limit bounds the
+            # work so this stays fast on a large database
+            cursor.execute("PRAGMA analysis_limit=400")
+            cursor.execute("PRAGMA optimize")
             logger.info(f"Analytics database initialized at {self.db_path}")
             
         except Exception as e:
             logger.error(f"Error initializing database: {e}", exc_info=True)
+            # Release the write lock so the next _ensure_open() starts clean
+            if self._writer is not None:
+                if self._writer.in_transaction:
+                    self._writer.execute("ROLLBACK")
+                self._writer.close()
+                self._writer = None
             raise
     
+    def _open_readers(self):
+        """Fill the reader pool with read-only connections"""
+        uri = Path(os.path.abspath(self.db_path)).as_uri() + "?mode=ro"
+        for _ in range(self.READER_POOL_SIZE):
+            reader = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            reader.row_factory = sqlite3.Row
+            for pragma in self._READER_PRAGMAS:
+                reader.execute(pragma)
+            self._readers.put(reader)
+    
+    @contextmanager
+    def _get_reader(self):
+        """
+        Check out a read-only connection for the duration of the block
+        
+        Yields:
+            Read-only connection from the pool
+        """
+        self._ensure_open()
+        reader = self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put(reader)
+    
+    @contextmanager
+    def _write_transaction(self):
+        """
+        Run the enclosed statements in one write transaction
+
+        BEGIN IMMEDIATE takes the write lock up front instead of upgrading a
+        read lock on the first write, which is what produces SQLITE_BUSY
+        when readers are active under WAL.
+
+        Yields:
+            Cursor to execute the writes on
+        """
+        self._ensure_open()
+        with self._writer_lock:
+            cursor = self._writer.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                cursor.execute("COMMIT")
+            except BaseException:
+                # A failed COMMIT can leave the transaction open; SQLite may
+                # also have rolled it back already
+                if self._writer.in_transaction:
+                    cursor.execute("ROLLBACK")
+                raise
+    
     def create_session(self, video_id: str, stream_title: str = "", game: str = "") -> int:
         """
         Create a new session
@@ -142,12 +449,11 @@ class AnalyticsDatabase:
             Session ID
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                INSERT INTO sessions (start_time, video_id, stream_title, game)
-                VALUES (?, ?, ?, ?)
-            """, (datetime.now(), video_id, stream_title, game))
-            self.connection.commit()
+            with self._write_transaction() as cursor:
+                cursor.execute(f"""
+                    INSERT INTO sessions (start_time, video_id, stream_title, game)
+                    VALUES ({_SQL_NOW}, ?, ?, ?)
+                """, (video_id, stream_title, game))
             
             session_id = cursor.lastrowid
             logger.info(f"Created new session {session_id} for video {video_id}")
@@ -160,13 +466,12 @@ class AnalyticsDatabase:
     def end_session(self, session_id: int):
         """Mark session as ended"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                UPDATE sessions 
-                SET end_time = ?, is_active = 0
-                WHERE id = ?
-            """, (datetime.now(), session_id))
-            self.connection.commit()
+            with self._write_transaction() as cursor:
+                cursor.execute(f"""
+                    UPDATE sessions 
+                    SET end_time = {_SQL_NOW}, is_active = 0
+                    WHERE id = ?
+                """, (session_id,))
             logger.info(f"Ended session {session_id}")
             
         except Exception as e:
@@ -176,103 +481,76 @@ class AnalyticsDatabase:
                    author_channel_id: str, message_text: str, 
                    is_command: bool = False, command_name: str = None):
         """Log a chat message"""
+        self.log_messages_bulk([
+            (session_id, message_id, author, author_channel_id, message_text,
+             is_command, command_name)
+        ])
+
+    def log_messages_bulk(self, rows: List[tuple]):
+        """
+        Log a batch of chat messages in a single transaction
+
+        Args:
+            rows: Tuples of (session_id, message_id, author, author_channel_id,
+                  message_text, is_command, command_name); the timestamp is
+                  set by SQLite at insert time
+        """
+        if not rows:
+            return
+
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                INSERT INTO messages 
-                (session_id, message_id, author, author_channel_id, message_text, 
-                 timestamp, is_command, command_name)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (session_id, message_id, author, author_channel_id, message_text,
-                  datetime.now(), is_command, command_name))
-            
-            # Update session message count
-            cursor.execute("""
-                UPDATE sessions 
-                SET total_messages = total_messages + 1
-                WHERE id = ?
-            """, (session_id,))
-            
-            self.connection.commit()
-            
-        except sqlite3.IntegrityError:
-            # Duplicate message_id, skip
-            pass
+            with self._write_transaction() as cursor:
+                # Duplicate message_ids are skipped rather than raising;
+                # sessions.total_messages is kept by trg_messages_count
+                cursor.executemany(self._SQL_INSERT_MESSAGE, rows)
+
         except Exception as e:
-            logger.error(f"Error logging message: {e}", exc_info=True)
+            logger.error(f"Error logging {len(rows)} messages: {e}", exc_info=True)
     
     def log_viewer_snapshot(self, session_id: int, viewer_count: int, likes: int = 0):
         """Log viewer count snapshot"""
+        self.log_viewer_snapshots_bulk([(session_id, viewer_count, likes)])
+    
+    def log_viewer_snapshots_bulk(self, rows: List[tuple], update_peak: bool = True):
+        """
+        Log a batch of viewer snapshots in a single transaction
+        
+        Args:
+            rows: Tuples of (session_id, viewer_count, likes)
+            update_peak: Whether to raise sessions.peak_viewers from the batch;
+                         callers tracking the peak themselves can skip the UPDATE
+                         when it hasn't changed
+        """
+        if not rows:
+            return
+        
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                INSERT INTO viewer_snapshots 
-                (session_id, timestamp, viewer_count, likes)
-                VALUES (?, ?, ?, ?)
-            """, (session_id, datetime.now(), viewer_count, likes))
-            
-            # Update peak viewers if needed
-            cursor.execute("""
-                UPDATE sessions 
-                SET peak_viewers = MAX(peak_viewers, ?)
-                WHERE id = ?
-            """, (viewer_count, session_id))
-            
-            self.connection.commit()
+            with self._write_transaction() as cursor:
+                cursor.executemany(self._SQL_INSERT_VIEWER_SNAPSHOT, rows)
+                
+                if update_peak:
+                    # One peak UPDATE per session instead of one per snapshot
+                    peaks: Dict[int, int] = {}
+                    for session_id, viewer_count, _ in rows:
+                        if viewer_count > peaks.get(session_id, -1):
+                            peaks[session_id] = viewer_count
+                    cursor.executemany(
+                        self._SQL_UPDATE_PEAK_VIEWERS,
+                        [(peak, session_id) for session_id, peak in peaks.items()]
+                    )
             
         except Exception as e:
-            logger.error(f"Error logging viewer snapshot: {e}", exc_info=True)
+            logger.error(f"Error logging {len(rows)} viewer snapshots: {e}", exc_info=True)
     
     def update_command_stats(self, session_id: int, command_name: str, 
                             success: bool, response_time: float):
         """Update command execution statistics"""
         try:
-            cursor = self.connection.cursor()
-            
-            # Check if record exists
-            cursor.execute("""
-                SELECT execution_count, success_count, failure_count, avg_response_time
-                FROM command_stats
-                WHERE session_id = ? AND command_name = ?
-            """, (session_id, command_name))
-            
-            row = cursor.fetchone()
-            
-            if row:
-                # Update existing record
-                exec_count = row[0] + 1
-                success_count = row[1] + (1 if success else 0)
-                failure_count = row[2] + (0 if success else 1)
-                # Running average
-                new_avg = ((row[3] * row[0]) + response_time) / exec_count
-                
-                cursor.execute("""
-                    UPDATE command_stats
-                    SET execution_count = ?,
-                        success_count = ?,
-                        failure_count = ?,
-                        avg_response_time = ?
-                    WHERE session_id = ? AND command_name = ?
-                """, (exec_count, success_count, failure_count, new_avg, 
-                      session_id, command_name))
-            else:
-                # Insert new record
-                cursor.execute("""
-                    INSERT INTO command_stats
-                    (session_id, command_name, execution_count, success_count, 
-                     failure_count, avg_response_time)
-                    VALUES (?, ?, 1, ?, ?, ?)
-                """, (session_id, command_name, 1 if success else 0,
-                      0 if success else 1, response_time))
-            
-            # Update session command count
-            cursor.execute("""
-                UPDATE sessions 
-                SET total_commands = total_commands + 1
-                WHERE id = ?
-            """, (session_id,))
-            
-            self.connection.commit()
+            succeeded = 1 if success else 0
+            with self._write_transaction() as cursor:
+                cursor.execute(self._SQL_UPSERT_COMMAND_STATS,
+                               (session_id, command_name, succeeded, 1 - succeeded,
+                                response_time))
             
         except Exception as e:
             logger.error(f"Error updating command stats: {e}", exc_info=True)
@@ -280,17 +558,10 @@ class AnalyticsDatabase:
     def get_top_chatters(self, session_id: int, limit: int = 5) -> List[Dict[str, Any]]:
         """Get top chatters for a session"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT author, COUNT(*) as message_count
-                FROM messages
-                WHERE session_id = ?
-                GROUP BY author
-                ORDER BY message_count DESC
-                LIMIT ?
-            """, (session_id, limit))
+            with self._get_reader() as reader:
+                cursor = reader.execute(self._SQL_TOP_CHATTERS, (session_id, limit))
             
-            return [dict(row) for row in cursor.fetchall()]
+                return [dict(row) for row in cursor.fetchall()]
             
         except Exception as e:
             logger.error(f"Error getting top chatters: {e}", exc_info=True)
@@ -308,36 +579,30 @@ class AnalyticsDatabase:
             List of dicts with author and message_count
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT m.author, COUNT(*) as message_count
-                FROM messages m
-                JOIN sessions s ON m.session_id = s.id
-                WHERE DATE(s.start_time) = ?
-                GROUP BY m.author
-                ORDER BY message_count DESC
-                LIMIT ?
-            """, (date_str, limit))
+            with self._get_reader() as reader:
+                cursor = reader.execute(self._SQL_TOP_CHATTERS_ON_DATE, (date_str, limit))
             
-            return [dict(row) for row in cursor.fetchall()]
+                return [dict(row) for row in cursor.fetchall()]
             
         except Exception as e:
             logger.error(f"Error getting top chatters by date: {e}", exc_info=True)
             return []
     
-    def get_recent_sessions(self, days: int = 7) -> List[Dict[str, Any]]:
+    def get_recent_sessions(self, days: int = 7) -> List[SessionSummary]:
         """Get recent sessions from the past N days"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT id, start_time, end_time, stream_title, total_messages, 
-                       total_commands, peak_viewers
-                FROM sessions
-                WHERE start_time >= datetime('now', '-' || ? || ' days')
-                ORDER BY start_time DESC
-            """, (days,))
+            with self._get_reader() as reader:
+                cursor = reader.cursor()
+                cursor.row_factory = _tuple_rows(SessionSummary)
+                cursor.execute("""
+                    SELECT id, start_time, end_time, stream_title, total_messages, 
+                           total_commands, peak_viewers
+                    FROM sessions
+                    WHERE start_time >= ?
+                    ORDER BY start_time DESC
+                """, (datetime.now() - timedelta(days=days),))
             
-            return [dict(row) for row in cursor.fetchall()]
+                return cursor.fetchall()
             
         except Exception as e:
             logger.error(f"Error getting recent sessions: {e}", exc_info=True)
@@ -346,18 +611,11 @@ class AnalyticsDatabase:
     def get_yesterday_top_chatters(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Get top chatters from yesterday"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT m.author, COUNT(*) as message_count
-                FROM messages m
-                JOIN sessions s ON m.session_id = s.id
-                WHERE DATE(s.start_time) = DATE('now', '-1 day')
-                GROUP BY m.author
-                ORDER BY message_count DESC
-                LIMIT ?
-            """, (limit,))
+            yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+            with self._get_reader() as reader:
+                cursor = reader.execute(self._SQL_TOP_CHATTERS_ON_DATE, (yesterday, limit))
             
-            return [dict(row) for row in cursor.fetchall()]
+                return [dict(row) for row in cursor.fetchall()]
             
         except Exception as e:
             logger.error(f"Error getting yesterday's top chatters: {e}", exc_info=True)
@@ -366,15 +624,13 @@ class AnalyticsDatabase:
     def get_session_stats(self, session_id: int) -> Optional[Dict[str, Any]]:
         """Get comprehensive session statistics"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT * FROM sessions WHERE id = ?
-            """, (session_id,))
+            with self._get_reader() as reader:
+                cursor = reader.execute(self._SQL_SESSION_STATS, (session_id,))
             
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
+                row = cursor.fetchone()
+                if row:
+                    return dict(row)
+                return None
             
         except Exception as e:
             logger.error(f"Error getting session stats: {e}", exc_info=True)
@@ -383,22 +639,52 @@ class AnalyticsDatabase:
     def get_command_stats(self, session_id: int) -> List[Dict[str, Any]]:
         """Get command statistics for a session"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT command_name, execution_count, success_count, 
-                       failure_count, avg_response_time
-                FROM command_stats
-                WHERE session_id = ?
-                ORDER BY execution_count DESC
-            """, (session_id,))
+            with self._get_reader() as reader:
+                cursor = reader.execute(self._SQL_COMMAND_STATS, (session_id,))
             
-            return [dict(row) for row in cursor.fetchall()]
+                return [dict(row) for row in cursor.fetchall()]
             
         except Exception as e:
             logger.error(f"Error getting command stats: {e}", exc_info=True)
             return []
     
-    def get_viewer_chat_history(self, author: str) -> List[Dict[str, Any]]:
+    def get_session_report(self, session_id: int, top_chatters_limit: int = 10) -> Optional[Dict[str, Any]]:
+        """
+        Get session stats, top chatters and command stats in one read
+        
+        The three queries run on a single reader inside one transaction, so
+        they see the same snapshot of the database.
+        
+        Args:
+            session_id: Session to report on
+            top_chatters_limit: Number of top chatters to include
+            
+        Returns:
+            Dict with session, top_chatters and commands, or None on error
+        """
+        try:
+            with self._get_reader() as reader:
+                reader.execute("BEGIN")
+                try:
+                    row = reader.execute(self._SQL_SESSION_STATS, (session_id,)).fetchone()
+                    top_chatters = reader.execute(
+                        self._SQL_TOP_CHATTERS, (session_id, top_chatters_limit)
+                    ).fetchall()
+                    commands = reader.execute(self._SQL_COMMAND_STATS, (session_id,)).fetchall()
+                finally:
+                    reader.execute("COMMIT")
+            
+            return {
+                "session": dict(row) if row else None,
+                "top_chatters": [dict(r) for r in top_chatters],
+                "commands": [dict(r) for r in commands]
+            }
+            
+        except Exception as e:
+            logger.error(f"Error getting session report: {e}", exc_info=True)
+            return None
+    
+    def get_viewer_chat_history(self, author: str) -> List[ViewerSession]:
         """
         Get all chat sessions for a specific viewer
         
@@ -406,81 +692,92 @@ class AnalyticsDatabase:
             author: Username of the viewer
             
         Returns:
-            List of dicts with session info and message counts
+            List of ViewerSession rows with session info and message counts
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT 
-                    s.id,
-                    s.start_time,
-                    s.stream_title,
-                    s.game,
-                    COUNT(m.id) as message_count
-                FROM sessions s
-                LEFT JOIN messages m ON s.id = m.session_id AND m.author = ?
-                WHERE m.author = ?
-                GROUP BY s.id
-                ORDER BY s.start_time DESC
-            """, (author, author))
-            
-            return [dict(row) for row in cursor.fetchall()]
+            with self._get_reader() as reader:
+                cursor = reader.cursor()
+                cursor.row_factory = _tuple_rows(ViewerSession)
+                cursor.execute("""
+                    SELECT 
+                        s.id,
+                        s.start_time,
+                        s.stream_title,
+                        s.game,
+                        COUNT(*) as message_count
+                    FROM messages m
+                    JOIN sessions s ON s.id = m.session_id
+                    WHERE m.author = ?
+                    GROUP BY m.session_id
+                    ORDER BY s.start_time DESC
+                """, (author,))
+            
+                return cursor.fetchall()
             
         except Exception as e:
             logger.error(f"Error getting viewer chat history for {author}: {e}", exc_info=True)
             return []
     
-    def get_viewer_stats(self, author: str) -> Optional[Dict[str, Any]]:
+    def get_viewer_stats(self, author: str, include_archive: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get comprehensive stats for a viewer
         
         Args:
             author: Username of the viewer
+            include_archive: Also count messages moved out by archive_old_messages()
             
         Returns:
             Dict with: first_chat_date, last_chat_date, total_messages, total_sessions
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT 
-                    MIN(m.timestamp) as first_chat_date,
-                    MAX(m.timestamp) as last_chat_date,
-                    COUNT(m.id) as total_messages,
-                    COUNT(DISTINCT m.session_id) as total_sessions
-                FROM messages m
-                WHERE m.author = ?
-            """, (author,))
-            
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
+            with self._get_reader() as reader:
+                cursor = reader.execute("""
+                    SELECT 
+                        MIN(m.timestamp) as first_chat_date,
+                        MAX(m.timestamp) as last_chat_date,
+                        COUNT(m.id) as total_messages,
+                        COUNT(DISTINCT m.session_id) as total_sessions
+                    FROM messages m
+                    WHERE m.author = ?
+                """, (author,))
+            
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                stats = dict(row)
+                if include_archive:
+                    self._add_archived_viewer_stats(reader, author, stats)
+                return stats
             
         except Exception as e:
             logger.error(f"Error getting viewer stats for {author}: {e}", exc_info=True)
             return None
     
-    def is_returning_viewer(self, author: str) -> bool:
+    def is_returning_viewer(self, author: str, current_session_id: Optional[int] = None) -> bool:
         """
         Check if viewer has chatted in any past session (before current session)
         
         Args:
             author: Username of the viewer
+            current_session_id: Session whose messages don't count, so the
+                answer doesn't depend on whether they're written yet
             
         Returns:
             True if viewer has chatted before, False if new
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT COUNT(*) as count
-                FROM messages
-                WHERE author = ?
-            """, (author,))
+            with self._get_reader() as reader:
+                cursor = reader.execute("""
+                    SELECT EXISTS(
+                        SELECT 1 FROM messages
+                        WHERE author = ? AND session_id != ?
+                    ) OR EXISTS(
+                        SELECT 1 FROM archived_authors WHERE author = ?
+                    ) as is_returning
+                """, (author, current_session_id if current_session_id is not None else -1, author))
             
-            row = cursor.fetchone()
-            return row['count'] > 0 if row else False
+                row = cursor.fetchone()
+                return bool(row['is_returning']) if row else False
             
         except Exception as e:
             logger.error(f"Error checking if viewer is returning: {e}", exc_info=True)
@@ -497,17 +794,20 @@ class AnalyticsDatabase:
             Number of days ago, or None if never chatted
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT CAST((julianday('now') - julianday(MAX(m.timestamp))) AS INTEGER) as days_ago
-                FROM messages m
-                WHERE m.author = ?
-            """, (author,))
-            
-            row = cursor.fetchone()
-            if row and row['days_ago'] is not None:
-                return row['days_ago']
-            return None
+            with self._get_reader() as reader:
+                cursor = reader.execute("""
+                    SELECT CAST((julianday('now') - julianday(MAX(last_chat))) AS INTEGER) as days_ago
+                    FROM (
+                        SELECT MAX(timestamp) as last_chat FROM messages WHERE author = ?
+                        UNION ALL
+                        SELECT last_chat FROM archived_authors WHERE author = ?
+                    )
+                """, (author, author))
+            
+                row = cursor.fetchone()
+                if row and row['days_ago'] is not None:
+                    return row['days_ago']
+                return None
             
         except Exception as e:
             logger.error(f"Error getting days since last chat for {author}: {e}", exc_info=True)
@@ -524,33 +824,216 @@ class AnalyticsDatabase:
             Dict with: session_id, start_time, stream_title, game, message_count
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("""
-                SELECT 
-                    s.id,
-                    s.start_time,
-                    s.stream_title,
-                    s.game,
-                    COUNT(m.id) as message_count
-                FROM sessions s
-                JOIN messages m ON s.id = m.session_id AND m.author = ?
-                WHERE m.author = ?
-                GROUP BY s.id
-                ORDER BY s.start_time DESC
-                LIMIT 1
-            """, (author, author))
-            
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
+            with self._get_reader() as reader:
+                cursor = reader.execute("""
+                    SELECT 
+                        s.id,
+                        s.start_time,
+                        s.stream_title,
+                        s.game,
+                        COUNT(*) as message_count
+                    FROM messages m
+                    JOIN sessions s ON s.id = m.session_id
+                    WHERE m.author = ?
+                    GROUP BY m.session_id
+                    ORDER BY s.start_time DESC
+                    LIMIT 1
+                """, (author,))
+            
+                row = cursor.fetchone()
+                if row:
+                    return dict(row)
+                return None
             
         except Exception as e:
             logger.error(f"Error getting most recent session info for {author}: {e}", exc_info=True)
             return None
     
+    def _archive_path(self, month: str) -> str:
+        """Path of the archive database for a YYYYMM month"""
+        return f"{os.path.splitext(self.db_path)[0]}_{month}.db"
+    
+    def _archive_paths(self) -> List[str]:
+        """Existing monthly archive databases, oldest first"""
+        return sorted(glob.glob(self._archive_path("[0-9]" * 6)))
+    
+    def _add_archived_viewer_stats(self, reader: sqlite3.Connection, author: str,
+                                   stats: Dict[str, Any]):
+        """
+        Fold a viewer's archived messages into stats from get_viewer_stats()
+        
+        Archives are attached one at a time, so any number of months can be
+        read without hitting SQLite's attached-database limit.
+        """
+        session_ids = {
+            row[0] for row in reader.execute(
+                "SELECT DISTINCT session_id FROM messages WHERE author = ?", (author,)
+            )
+        }
+        for path in self._archive_paths():
+            uri = Path(os.path.abspath(path)).as_uri() + "?mode=ro"
+            reader.execute("ATTACH DATABASE ? AS archive", (uri,))
+            try:
+                first, last, count = reader.execute("""
+                    SELECT MIN(timestamp), MAX(timestamp), COUNT(*)
+                    FROM archive.messages
+                    WHERE author = ?
+                """, (author,)).fetchone()
+                if not count:
+                    continue
+                session_ids.update(row[0] for row in reader.execute(
+                    "SELECT DISTINCT session_id FROM archive.messages WHERE author = ?",
+                    (author,)
+                ))
+            finally:
+                reader.execute("DETACH DATABASE archive")
+            
+            stats["total_messages"] += count
+            if stats["first_chat_date"] is None or first < stats["first_chat_date"]:
+                stats["first_chat_date"] = first
+            if stats["last_chat_date"] is None or last > stats["last_chat_date"]:
+                stats["last_chat_date"] = last
+        stats["total_sessions"] = len(session_ids)
+    
+    def archive_old_messages(self, months: int = 6) -> int:
+        """
+        Move messages older than N months into monthly archive databases
+        
+        Each calendar month goes to its own file next to the main database
+        (e.g. data/analytics_202501.db), keeping the main messages table and
+        its indexes small enough to stay in the page cache. Session totals
+        and daily_chatter_counts are left as they are. Each archived viewer's
+        last chat time is kept in archived_authors, which is_returning_viewer()
+        and get_days_since_last_chat() also read; full counts come from
+        get_viewer_stats(include_archive=True).
+        
+        Args:
+            months: Number of whole months (plus the current one) to keep
+            
+        Returns:
+            Number of messages moved
+        """
+        now = datetime.now()
+        year, month = divmod(now.year * 12 + now.month - 1 - months, 12)
+        cutoff = f"{year:04d}-{month + 1:02d}-01"
+        moved = 0
+        
+        try:
+            self._ensure_open()
+            with self._writer_lock:
+                # Rowids follow insertion order, so this finds the oldest
+                # message without scanning and skips the run when none is due
+                oldest = self._writer.execute(
+                    "SELECT timestamp FROM messages ORDER BY id LIMIT 1"
+                ).fetchone()
+                if oldest is None or oldest[0] >= cutoff:
+                    return 0
+                
+                old_months = [row[0] for row in self._writer.execute("""
+                    SELECT DISTINCT substr(timestamp, 1, 7)
+                    FROM messages
+                    WHERE timestamp < ?
+                """, (cutoff,))]
+                
+                for year_month in old_months:
+                    year, month = map(int, year_month.split("-"))
+                    start = f"{year:04d}-{month:02d}-01"
+                    year, month = divmod(year * 12 + month, 12)
+                    end = f"{year:04d}-{month + 1:02d}-01"
+                    
+                    # ATTACH/DETACH can't run inside a transaction
+                    self._writer.execute(
+                        "ATTACH DATABASE ? AS archive",
+                        (self._archive_path(year_month.replace("-", "")),)
+                    )
+                    try:
+                        self._writer.execute("BEGIN IMMEDIATE")
+                        try:
+                            self._writer.execute("""
+                                CREATE TABLE IF NOT EXISTS archive.messages (
+                                    id INTEGER PRIMARY KEY,
+                                    session_id INTEGER NOT NULL,
+                                    message_id TEXT UNIQUE,
+                                    author TEXT NOT NULL,
+                                    author_channel_id TEXT,
+                                    message_text TEXT,
+                                    timestamp TIMESTAMP NOT NULL,
+                                    is_command BOOLEAN DEFAULT 0,
+                                    command_name TEXT
+                                )
+                            """)
+                            self._writer.execute("""
+                                CREATE INDEX IF NOT EXISTS archive.idx_messages_author_ts
+                                ON messages(author, timestamp)
+                            """)
+                            self._writer.execute("""
+                                INSERT INTO main.archived_authors (author, last_chat)
+                                SELECT author, MAX(timestamp) FROM main.messages
+                                WHERE timestamp >= ? AND timestamp < ?
+                                GROUP BY author
+                                ON CONFLICT(author) DO UPDATE SET
+                                    last_chat = MAX(last_chat, excluded.last_chat)
+                            """, (start, end))
+                            self._writer.execute("""
+                                INSERT OR IGNORE INTO archive.messages
+                                SELECT * FROM main.messages
+                                WHERE timestamp >= ? AND timestamp < ?
+                            """, (start, end))
+                            cursor = self._writer.execute("""
+                                DELETE FROM main.messages
+                                WHERE timestamp >= ? AND timestamp < ?
+                            """, (start, end))
+                            moved += cursor.rowcount
+                            self._writer.execute("COMMIT")
+                        except BaseException:
+                            if self._writer.in_transaction:
+                                self._writer.execute("ROLLBACK")
+                            raise
+                    finally:
+                        self._writer.execute("DETACH DATABASE archive")
+                
+                if moved:
+                    # Hand the freed pages back to the filesystem
+                    self._writer.execute("VACUUM")
+            
+            logger.info(f"Archived {moved} messages older than {cutoff}")
+            
+        except Exception as e:
+            logger.error(f"Error archiving old messages: {e}", exc_info=True)
+        
+        return moved
+    
+    def maintenance(self):
+        """
+        Run periodic database maintenance
+        
+        Gathers full planner statistics with ANALYZE and truncates the WAL
+        file. Blocks while it runs, so call it off the event loop.
+        """
+        try:
+            self._ensure_open()
+            with self._writer_lock:
+                self._writer.execute("ANALYZE")
+                self._writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            logger.info("Analytics database maintenance complete")
+            
+        except Exception as e:
+            logger.error(f"Error running database maintenance: {e}", exc_info=True)
+    
     def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
+        """Close reader pool and writer connection"""
+        if self._writer:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+            with self._writer_lock:
+                try:
+                    self._writer.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    logger.warning(f"PRAGMA optimize failed on close: {e}")
+                self._writer.close()
+                self._writer = None
+            self._opened = False
             logger.info("Analytics database connection closed")
@@ -2,7 +2,11 @@
 Analytics tracker for monitoring stream and bot metrics
 """
 
+import atexit
+import queue
+import threading
 import time
+from collections import Counter
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from .database import AnalyticsDatabase
@@ -15,6 +19,21 @@ class AnalyticsTracker:
     """Main analytics tracking class"""
     
     _instance: Optional['AnalyticsTracker'] = None
+
+    # Writes are handed to a background thread through a bounded queue and
+    # committed in batches of up to WRITE_BATCH_SIZE items or
+    # WRITE_BATCH_SECONDS, whichever comes first
+    WRITE_QUEUE_SIZE = 10000
+    WRITE_BATCH_SIZE = 500
+    WRITE_BATCH_SECONDS = 1.0
+    FLUSH_TIMEOUT_SECONDS = 5.0
+
+    # Write queue item kinds
+    _MESSAGE = "msg"
+    _SNAPSHOT = "snapshot"
+    _COMMAND = "cmd"
+    _FLUSH = "flush"
+    _STOP = "stop"
     
     def __init__(self, db_path: str = "data/analytics.db"):
         """
@@ -33,6 +52,28 @@ class AnalyticsTracker:
         self.total_response_time = 0.0
         self.api_calls_success = 0
         self.api_calls_total = 0
+
+        # Per-author message counts for the current session, so the live
+        # leaderboard is a top-K selection in memory instead of a DB query
+        self._chatter_counts: Counter = Counter()
+
+        # Highest viewer count seen this session; sessions.peak_viewers is
+        # only rewritten when a snapshot raises it
+        self._local_peak = 0
+
+        # Chat handlers only enqueue; SQLite commits happen on this thread
+        self._write_queue: "queue.Queue[tuple]" = queue.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="analytics-writer", daemon=True
+        )
+        self._writer_thread.start()
+        # The writer is a daemon thread, so drain its queue on exit
+        atexit.register(self.close)
+
+        # Per-session memo of historical viewer lookups; whether someone
+        # chatted in earlier streams can't change mid-stream
+        self._returning_cache: Dict[str, bool] = {}
+        self._days_cache: Dict[str, Optional[int]] = {}
         
         logger.info("Analytics tracker initialized")
     
@@ -57,6 +98,10 @@ class AnalyticsTracker:
         self.total_response_time = 0.0
         self.api_calls_success = 0
         self.api_calls_total = 0
+        self._local_peak = 0
+        self._chatter_counts.clear()
+        self._returning_cache.clear()
+        self._days_cache.clear()
         
         logger.info(f"Started analytics session {self.current_session_id}")
         return self.current_session_id
@@ -64,6 +109,7 @@ class AnalyticsTracker:
     def end_session(self):
         """End the current analytics session"""
         if self.current_session_id:
+            self.flush()
             self.db.end_session(self.current_session_id)
             logger.info(f"Ended analytics session {self.current_session_id}")
             self.current_session_id = None
@@ -86,7 +132,7 @@ class AnalyticsTracker:
             logger.warning("Cannot track message: no active session")
             return
         
-        self.db.log_message(
+        self._enqueue(self._MESSAGE, (
             self.current_session_id,
             message_id,
             author,
@@ -94,9 +140,92 @@ class AnalyticsTracker:
             message_text,
             is_command,
             command_name
-        )
+        ))
         
         self.messages_processed += 1
+        self._chatter_counts[author] += 1
+
+    def _enqueue(self, kind: str, payload: Any):
+        """Hand a write to the background writer, dropping it if the queue is full"""
+        try:
+            self._write_queue.put_nowait((kind, payload))
+        except queue.Full:
+            logger.warning(f"Analytics write queue full, dropping {kind} write")
+
+    def _writer_loop(self):
+        """Background thread: drain the write queue in batches until stopped"""
+        while True:
+            batch = [self._write_queue.get()]
+            deadline = time.monotonic() + self.WRITE_BATCH_SECONDS
+            # Keep collecting until the batch is full or the window closes;
+            # flush/stop requests end the batch early
+            while (len(batch) < self.WRITE_BATCH_SIZE and
+                   batch[-1][0] not in (self._FLUSH, self._STOP)):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            if self._write_batch(batch):
+                return
+
+    def _write_batch(self, batch: List[tuple]) -> bool:
+        """
+        Write one batch of queued items, grouped by kind
+        
+        Args:
+            batch: (kind, payload) items taken from the write queue
+            
+        Returns:
+            True if the batch contained the stop sentinel
+        """
+        messages: List[tuple] = []
+        snapshots: List[tuple] = []
+        commands: List[tuple] = []
+        waiters: List[threading.Event] = []
+        peak_raised = False
+        stop = False
+        
+        for kind, payload in batch:
+            if kind == self._MESSAGE:
+                messages.append(payload)
+            elif kind == self._SNAPSHOT:
+                row, raised = payload
+                snapshots.append(row)
+                peak_raised = peak_raised or raised
+            elif kind == self._COMMAND:
+                commands.append(payload)
+            elif kind == self._FLUSH:
+                waiters.append(payload)
+            elif kind == self._STOP:
+                stop = True
+        
+        try:
+            if messages:
+                self.db.log_messages_bulk(messages)
+            if snapshots:
+                self.db.log_viewer_snapshots_bulk(snapshots, update_peak=peak_raised)
+            for args in commands:
+                self.db.update_command_stats(*args)
+        except Exception as e:
+            logger.error(f"Analytics writer failed on batch of {len(batch)}: {e}", exc_info=True)
+        finally:
+            for done in waiters:
+                done.set()
+        
+        return stop
+
+    def flush(self):
+        """Block until every write queued so far has been committed"""
+        if not self._writer_thread.is_alive():
+            return
+        done = threading.Event()
+        self._write_queue.put((self._FLUSH, done))
+        if not done.wait(self.FLUSH_TIMEOUT_SECONDS):
+            logger.warning("Timed out waiting for analytics writes to flush")
     
     def track_viewer_count(self, viewer_count: int, likes: int = 0):
         """
@@ -110,7 +239,14 @@ class AnalyticsTracker:
             logger.warning("Cannot track viewers: no active session")
             return
         
-        self.db.log_viewer_snapshot(self.current_session_id, viewer_count, likes)
+        raised = viewer_count > self._local_peak
+        if raised:
+            self._local_peak = viewer_count
+        
+        self._enqueue(self._SNAPSHOT, (
+            (self.current_session_id, viewer_count, likes),
+            raised
+        ))
     
     def track_command_execution(self, command_name: str, success: bool, 
                                response_time: float):
@@ -126,12 +262,12 @@ class AnalyticsTracker:
             logger.warning("Cannot track command: no active session")
             return
         
-        self.db.update_command_stats(
+        self._enqueue(self._COMMAND, (
             self.current_session_id,
             command_name,
             success,
             response_time
-        )
+        ))
         
         self.commands_executed += 1
         self.total_response_time += response_time
@@ -160,7 +296,11 @@ class AnalyticsTracker:
         if not self.current_session_id:
             return []
         
-        return self.db.get_top_chatters(self.current_session_id, limit)
+        # most_common() selects the top entries with a heap, no full sort
+        return [
+            {"author": author, "message_count": count}
+            for author, count in self._chatter_counts.most_common(limit)
+        ]
     
     def get_session_stats(self) -> Optional[Dict[str, Any]]:
         """
@@ -172,6 +312,7 @@ class AnalyticsTracker:
         if not self.current_session_id:
             return None
         
+        self.flush()
         return self.db.get_session_stats(self.current_session_id)
     
     def get_command_stats(self) -> List[Dict[str, Any]]:
@@ -184,8 +325,40 @@ class AnalyticsTracker:
         if not self.current_session_id:
             return []
         
+        self.flush()
         return self.db.get_command_stats(self.current_session_id)
     
+    def is_returning_viewer(self, author: str) -> bool:
+        """
+        Check if viewer chatted in an earlier session, memoized for the session
+        
+        Args:
+            author: Username of the viewer
+            
+        Returns:
+            True if viewer has chatted before, False if new
+        """
+        cached = self._returning_cache.get(author)
+        if cached is None:
+            cached = self._returning_cache[author] = self.db.is_returning_viewer(
+                author, self.current_session_id
+            )
+        return cached
+    
+    def get_days_since_last_chat(self, author: str) -> Optional[int]:
+        """
+        Get days since viewer last chatted, memoized for the session
+        
+        Args:
+            author: Username of the viewer
+            
+        Returns:
+            Number of days ago, or None if never chatted
+        """
+        if author not in self._days_cache:
+            self._days_cache[author] = self.db.get_days_since_last_chat(author)
+        return self._days_cache[author]
+    
     def get_bot_metrics(self) -> Dict[str, Any]:
         """
         Get current bot performance metrics
@@ -225,27 +398,28 @@ class AnalyticsTracker:
         if not self.current_session_id:
             return None
         
-        session_stats = self.get_session_stats()
-        top_chatters = self.get_top_chatters(10)
-        command_stats = self.get_command_stats()
-        bot_metrics = self.get_bot_metrics()
+        self.flush()
+        report = self.db.get_session_report(self.current_session_id, 10)
+        if report is None:
+            return None
         
-        return {
-            "session": session_stats,
-            "top_chatters": top_chatters,
-            "commands": command_stats,
-            "bot_metrics": bot_metrics,
-            "export_time": datetime.now().isoformat()
-        }
+        report["bot_metrics"] = self.get_bot_metrics()
+        report["export_time"] = datetime.now().isoformat()
+        return report
     
     def close(self):
         """Close analytics tracker and database"""
         self.end_session()
+        if self._writer_thread.is_alive():
+            # Stop is queued behind any pending writes, so they land first
+            self._write_queue.put((self._STOP, None))
+            self._writer_thread.join()
         self.db.close()
 
 
 # Singleton instance
 _tracker_instance: Optional[AnalyticsTracker] = None
+_tracker_lock = threading.Lock()
 
 
 def get_analytics_tracker() -> AnalyticsTracker:
@@ -257,5 +431,7 @@ def get_analytics_tracker() -> AnalyticsTracker:
     """
     global _tracker_instance
     if _tracker_instance is None:
-        _tracker_instance = AnalyticsTracker()
+        with _tracker_lock:
+            if _tracker_instance is None:
+                _tracker_instance = AnalyticsTracker()
     return _tracker_instance
@@ -3,17 +3,24 @@ Advanced chat features for YouTube Chat Bot
 Includes rate limiting, spam detection, user engagement tracking
 """
 
+import re
 import time
 import logging
-from typing import Dict, Optional
-from collections import defaultdict
+from typing import Dict, Optional, Tuple
+from collections import Counter, defaultdict, deque
 from app.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class RateLimiter:
-    """Simple rate limiter to prevent spam"""
+    """
+    Sliding-window-counter rate limiter to prevent spam
+    
+    Each user keeps only the call counts of the current and previous fixed
+    windows; the rate over the trailing period is estimated by weighting the
+    previous window by how much of it still overlaps the sliding window.
+    """
     
     def __init__(self, calls_per_period: int = 1, period_seconds: int = 5):
         """
@@ -25,7 +32,8 @@ class RateLimiter:
         """
         self.calls_per_period = calls_per_period
         self.period_seconds = period_seconds
-        self.calls: Dict[str, list] = defaultdict()  # user_id -> list of timestamps
+        # user_id -> (current window index, previous window count, current window count)
+        self.buckets: Dict[str, Tuple[int, int, int]] = {}
     
     def is_allowed(self, user_id: str) -> bool:
         """
@@ -38,34 +46,37 @@ class RateLimiter:
             True if action is allowed, False if rate limited
         """
         now = time.time()
+        window, elapsed = divmod(now, self.period_seconds)
+        window = int(window)
         
-        if user_id not in self.calls:
-            self.calls[user_id] = []
-        
-        # Remove old calls outside the period
-        self.calls[user_id] = [
-            timestamp for timestamp in self.calls[user_id]
-            if now - timestamp < self.period_seconds
-        ]
+        bucket_window, prev, curr = self.buckets.get(user_id, (window, 0, 0))
+        if bucket_window == window - 1:
+            # Rolled into the next window
+            prev, curr = curr, 0
+        elif bucket_window != window:
+            # Idle for more than a full window
+            prev, curr = 0, 0
         
         # Check if under limit
-        if len(self.calls[user_id]) < self.calls_per_period:
-            self.calls[user_id].append(now)
+        estimated = prev * (1 - elapsed / self.period_seconds) + curr
+        if estimated < self.calls_per_period:
+            curr += 1
+            self.buckets[user_id] = (window, prev, curr)
             return True
         
+        self.buckets[user_id] = (window, prev, curr)
         return False
     
     def reset_user(self, user_id: str):
         """Reset rate limit for a specific user"""
-        if user_id in self.calls:
-            del self.calls[user_id]
+        self.buckets.pop(user_id, None)
 
 
 class UserEngagementTracker:
     """Track user engagement metrics"""
     
     def __init__(self):
-        self.user_messages: Dict[str, int] = defaultdict(int)
+        self.user_messages: Counter = Counter()
         self.user_first_seen: Dict[str, float] = {}
         self.user_last_seen: Dict[str, float] = {}
     
@@ -90,18 +101,13 @@ class UserEngagementTracker:
     
     def get_top_users(self, limit: int = 10) -> list:
         """Get most active users"""
-        sorted_users = sorted(
-            self.user_messages.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
         return [
             {
                 "username": username,
                 "messages": count,
                 "stats": self.get_user_stats(username)
             }
-            for username, count in sorted_users[:limit]
+            for username, count in self.user_messages.most_common(limit)
         ]
 
 
@@ -118,43 +124,58 @@ class SpamDetector:
         "youtube.com",
     ]
     
+    # All patterns in one alternation, so a message is scanned once rather
+    # than once per pattern
+    _SPAM_RE = re.compile("|".join(map(re.escape, SPAM_PATTERNS)))
+    
+    # Messages shorter than this can't contain any pattern
+    MIN_PATTERN_LEN = min(len(p) for p in SPAM_PATTERNS)
+    
     # Repetition threshold
     REPETITION_THRESHOLD = 3  # Same message 3+ times
+    HISTORY_SIZE = 10  # Messages remembered per user
     
     def __init__(self):
-        self.message_history: Dict[str, list] = defaultdict(list)
+        # Last HISTORY_SIZE messages per user, plus a running count of each
+        # so repetition checks don't scan the history
+        self._history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.HISTORY_SIZE))
+        self._counts: Dict[str, Counter] = defaultdict(Counter)
     
-    def is_spam(self, username: str, message: str) -> bool:
+    def is_spam(self, username: str, message: str,
+                message_lower: Optional[str] = None) -> bool:
         """
         Check if message is spam
         
         Args:
             username: Author of message
             message: Message text
+            message_lower: Lowercased message, if the caller already has it
             
         Returns:
             True if message appears to be spam
         """
-        msg_lower = message.lower()
-        
         # Check against known spam patterns
-        for pattern in self.SPAM_PATTERNS:
-            if pattern in msg_lower:
+        if len(message) >= self.MIN_PATTERN_LEN:
+            if message_lower is None:
+                message_lower = message.lower()
+            if self._SPAM_RE.search(message_lower):
                 logger.debug(f"Spam detected from {username}: {message[:30]}...")
                 return True
         
         # Check for repetition
-        if username in self.message_history:
-            if message in self.message_history[username]:
-                count = self.message_history[username].count(message)
-                if count >= self.REPETITION_THRESHOLD:
-                    logger.debug(f"Repetitive spam from {username}: {message[:30]}...")
-                    return True
+        counts = self._counts[username]
+        if counts[message] >= self.REPETITION_THRESHOLD:
+            logger.debug(f"Repetitive spam from {username}: {message[:30]}...")
+            return True
         
-        # Store message
-        self.message_history[username].append(message)
-        # Keep only last 10 messages per user
-        if len(self.message_history[username]) > 10:
-            self.message_history[username].pop(0)
+        # Store message, keeping only the last HISTORY_SIZE per user
+        history = self._history[username]
+        if len(history) == self.HISTORY_SIZE:
+            evicted = history[0]
+            counts[evicted] -= 1
+            if not counts[evicted]:
+                del counts[evicted]
+        history.append(message)
+        counts[message] += 1
         
         return False
@@ -1,17 +1,50 @@
-try:
-    from google.adk.runners import Runner
-    print("Runner found in google.adk.runners")
-except ImportError:
-    print("Runner NOT found in google.adk.runners")
-
-try:
-    from google.adk.sessions import InMemorySessionService
-    print("InMemorySessionService found in google.adk.sessions")
-except ImportError:
-    print("InMemorySessionService NOT found in google.adk.sessions")
-
-try:
-    from google.adk.sessions.in_memory import InMemorySessionService
-    print("InMemorySessionService found in google.adk.sessions.in_memory")
-except ImportError:
-    print("InMemorySessionService NOT found in google.adk.sessions.in_memory")
+"""
+Probe which google-adk import paths are available
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def adk_session_service():
+    """
+    Locate InMemorySessionService across google-adk layouts
+
+    Returns:
+        The InMemorySessionService class, or None if google-adk doesn't provide it
+    """
+    try:
+        from google.adk.sessions import InMemorySessionService
+        return InMemorySessionService
+    except ImportError:
+        pass
+    try:
+        from google.adk.sessions.in_memory import InMemorySessionService
+        return InMemorySessionService
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def adk_runner():
+    """
+    Locate the google-adk Runner class
+
+    Returns:
+        The Runner class, or None if google-adk doesn't provide it
+    """
+    try:
+        from google.adk.runners import Runner
+        return Runner
+    except ImportError:
+        return None
+
+
+if __name__ == "__main__":
+    runner = adk_runner()
+    print(f"Runner {'found' if runner else 'NOT found'} in google.adk.runners")
+    service = adk_session_service()
+    if service:
+        print(f"InMemorySessionService found in {service.__module__}")
+    else:
+        print("InMemorySessionService NOT found in google.adk.sessions")
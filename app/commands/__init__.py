@@ -3,12 +3,47 @@ Command system for YouTube Chat Bot
 Handles parsing and executing user commands
 """
 
+import importlib
+
 from .parser import CommandParser
 from .command import BaseCommand, CommandContext
-from .builtins import HelpCommand, PingCommand, UptimeCommand, SocialsCommand, StatusCommand
-from .valorant import ValorantStatsCommand, ValorantAgentCommand, ValorantMapCommand
-from .analytics import ViewersCommand, LeaderboardCommand, TopChattersCommand, BotStatsCommand, ExportCommand
-from .growth import SetSubscriberGoalCommand, StartChallengeCommand, ViewGrowthStatsCommand, ChallengeProgressCommand, CancelChallengeCommand, SetCurrentSubscribersCommand
+# Command classes are imported on first access (PEP 562) so importing the
+# package doesn't pull in every command module and its dependencies
+_LAZY_COMMANDS = {
+    "HelpCommand": "builtins",
+    "PingCommand": "builtins",
+    "UptimeCommand": "builtins",
+    "SocialsCommand": "builtins",
+    "StatusCommand": "builtins",
+    "ValorantStatsCommand": "valorant",
+    "ValorantAgentCommand": "valorant",
+    "ValorantMapCommand": "valorant",
+    "ViewersCommand": "analytics",
+    "LeaderboardCommand": "analytics",
+    "TopChattersCommand": "analytics",
+    "BotStatsCommand": "analytics",
+    "ExportCommand": "analytics",
+    "SetSubscriberGoalCommand": "growth",
+    "StartChallengeCommand": "growth",
+    "ViewGrowthStatsCommand": "growth",
+    "ChallengeProgressCommand": "growth",
+    "CancelChallengeCommand": "growth",
+    "SetCurrentSubscribersCommand": "growth",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_COMMANDS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_COMMANDS))
+
 
 __all__ = [
     "CommandParser", 
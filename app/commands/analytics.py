@@ -2,16 +2,51 @@
 Analytics commands for stream and bot statistics
 """
 
+import asyncio
 import json
 import os
+import re
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 from .command import BaseCommand, CommandContext
 from app.logger import get_logger
 from app.analytics import get_analytics_tracker
+from app.chat_features import RateLimiter
 
 logger = get_logger(__name__)
 
+# Leaderboard place markers, 1st through 5th
+_MEDALS = ("🥇", "🥈", "🥉", "4️⃣", "5️⃣")
+
+# Shape of a !topchatters date argument, checked before strptime
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Where !export writes session reports
+_REPORTS_DIR = "logs/session_reports"
+os.makedirs(_REPORTS_DIR, exist_ok=True)
+
+# One full traceback per exception type per minute; repeats log a single line
+_error_traceback_limiter = RateLimiter(calls_per_period=1, period_seconds=60)
+
+_analytics = None
+
+
+def _tracker():
+    """Analytics tracker singleton, looked up once per process"""
+    global _analytics
+    if _analytics is None:
+        _analytics = get_analytics_tracker()
+    return _analytics
+
+
+def _log_command_error(command: str, e: Exception):
+    """Log a command failure, with the traceback only if one wasn't logged recently"""
+    if _error_traceback_limiter.is_allowed(type(e).__name__):
+        logger.error(f"Error in {command} command: {e}", exc_info=True)
+    else:
+        logger.error(f"Error in {command} command: {type(e).__name__}: {e}")
+
 
 class ViewersCommand(BaseCommand):
     """Show current viewer statistics"""
@@ -33,7 +68,7 @@ class ViewersCommand(BaseCommand):
             viewer_count = stats.get('viewer_count', 0)
             
             # Get active chatters from analytics
-            analytics = get_analytics_tracker()
+            analytics = _tracker()
             top_chatters = analytics.get_top_chatters(100)  # Get all chatters
             active_chatters = len(top_chatters)
             
@@ -42,14 +77,14 @@ class ViewersCommand(BaseCommand):
             if viewer_count > 0:
                 engagement_rate = (active_chatters / viewer_count) * 100
             
-            response = f"👥 **{viewer_count}** viewers watching\n"
-            response += f"💬 **{active_chatters}** active chatters\n"
-            response += f"📊 Engagement: **{engagement_rate:.1f}%**"
-            
-            return response
+            return "\n".join((
+                f"👥 **{viewer_count}** viewers watching",
+                f"💬 **{active_chatters}** active chatters",
+                f"📊 Engagement: **{engagement_rate:.1f}%**",
+            ))
             
         except Exception as e:
-            logger.error(f"Error in viewers command: {e}", exc_info=True)
+            _log_command_error("viewers", e)
             return "❌ Error fetching viewer stats"
 
 
@@ -61,29 +96,48 @@ class LeaderboardCommand(BaseCommand):
     description = "Show most active chatters this stream"
     usage = "!top or !leaderboard"
     
+    # Bursts of !top reuse the last response for a few seconds
+    CACHE_TTL_SECONDS = 5.0
+    
+    def __init__(self):
+        super().__init__()
+        self._cached_session: Optional[int] = None
+        self._cached_at = 0.0
+        self._cached_response = ""
+    
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute leaderboard command"""
         try:
-            analytics = get_analytics_tracker()
-            top_chatters = analytics.get_top_chatters(5)
-            
-            if not top_chatters:
-                return "No chat activity yet this stream!"
-            
-            response = "🏆 **Top Chatters:**\n"
-            medals = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"]
-            
-            for idx, chatter in enumerate(top_chatters):
-                medal = medals[idx] if idx < len(medals) else f"{idx+1}."
-                author = chatter['author']
-                count = chatter['message_count']
-                response += f"{medal} **{author}** - {count} messages\n"
-            
-            return response.rstrip()
+            analytics = _tracker()
+            session_id = analytics.current_session_id
+            now = time.monotonic()
+            if (self._cached_response and session_id == self._cached_session and
+                    now - self._cached_at < self.CACHE_TTL_SECONDS):
+                return self._cached_response
+            
+            response = self._build_response(analytics.get_top_chatters(5))
+            self._cached_session = session_id
+            self._cached_at = now
+            self._cached_response = response
+            return response
             
         except Exception as e:
-            logger.error(f"Error in leaderboard command: {e}", exc_info=True)
+            _log_command_error("leaderboard", e)
             return "❌ Error fetching leaderboard"
+    
+    @staticmethod
+    def _build_response(top_chatters) -> str:
+        """Format the leaderboard message"""
+        if not top_chatters:
+            return "No chat activity yet this stream!"
+            
+        parts = ["🏆 **Top Chatters:**"]
+        
+        for idx, chatter in enumerate(top_chatters):
+            medal = _MEDALS[idx] if idx < len(_MEDALS) else f"{idx+1}."
+            parts.append(f"{medal} **{chatter['author']}** - {chatter['message_count']} messages")
+        
+        return "\n".join(parts)
 
 
 class TopChattersCommand(BaseCommand):
@@ -97,20 +151,24 @@ class TopChattersCommand(BaseCommand):
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute topchatters command"""
         try:
-            analytics = get_analytics_tracker()
-            args = context.message.strip().split()
+            analytics = _tracker()
+            date_arg = self.parse_first_arg(context.message)
+            
+            today = datetime.now().date()
             
             # Determine which date to query
-            if len(args) > 1:
-                date_arg = args[1].lower()
+            if date_arg:
+                date_arg = date_arg.lower()
                 if date_arg == "yesterday":
-                    date_str = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+                    date_str = (today - timedelta(days=1)).isoformat()
                     label = "Yesterday's"
                 elif date_arg == "today":
-                    date_str = datetime.now().strftime("%Y-%m-%d")
+                    date_str = today.isoformat()
                     label = "Today's"
                 else:
                     # Try to parse as date
+                    if not _DATE_RE.fullmatch(date_arg):
+                        return "Invalid date format. Use: !topchatters [yesterday|today|YYYY-MM-DD]"
                     try:
                         datetime.strptime(date_arg, "%Y-%m-%d")
                         date_str = date_arg
@@ -119,7 +177,7 @@ class TopChattersCommand(BaseCommand):
                         return "Invalid date format. Use: !topchatters [yesterday|today|YYYY-MM-DD]"
             else:
                 # Default to yesterday
-                date_str = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+                date_str = (today - timedelta(days=1)).isoformat()
                 label = "Yesterday's"
             
             top_chatters = analytics.db.get_top_chatters_by_date(date_str, limit=5)
@@ -127,19 +185,16 @@ class TopChattersCommand(BaseCommand):
             if not top_chatters:
                 return f"No chat activity found for {date_str}"
             
-            response = f"🏆 **{label} Top Chatters:**\n"
-            medals = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"]
+            parts = [f"🏆 **{label} Top Chatters:**"]
             
             for idx, chatter in enumerate(top_chatters):
-                medal = medals[idx] if idx < len(medals) else f"{idx+1}."
-                author = chatter['author']
-                count = chatter['message_count']
-                response += f"{medal} **{author}** - {count} messages\n"
+                medal = _MEDALS[idx] if idx < len(_MEDALS) else f"{idx+1}."
+                parts.append(f"{medal} **{chatter['author']}** - {chatter['message_count']} messages")
             
-            return response.rstrip()
+            return "\n".join(parts)
             
         except Exception as e:
-            logger.error(f"Error in topchatters command: {e}", exc_info=True)
+            _log_command_error("topchatters", e)
             return "❌ Error fetching top chatters"
 
 
@@ -154,7 +209,7 @@ class BotStatsCommand(BaseCommand):
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute botstats command"""
         try:
-            analytics = get_analytics_tracker()
+            analytics = _tracker()
             metrics = analytics.get_bot_metrics()
             
             # Format uptime
@@ -164,19 +219,21 @@ class BotStatsCommand(BaseCommand):
             # Format response time
             avg_response_ms = metrics['avg_response_time'] * 1000
             
-            response = "🤖 **Bot Stats:**\n"
-            response += f"⏱️ Uptime: {uptime_str}\n"
-            response += f"💬 Messages: {metrics['messages_processed']}\n"
-            response += f"⚡ Commands: {metrics['commands_executed']}\n"
-            response += f"⚙️ Avg Response: {avg_response_ms:.0f}ms\n"
+            parts = [
+                "🤖 **Bot Stats:**",
+                f"⏱️ Uptime: {uptime_str}",
+                f"💬 Messages: {metrics['messages_processed']}",
+                f"⚡ Commands: {metrics['commands_executed']}",
+                f"⚙️ Avg Response: {avg_response_ms:.0f}ms",
+            ]
             
             if metrics['api_calls_total'] > 0:
-                response += f"🌐 API Success: {metrics['api_success_rate']:.1f}%"
+                parts.append(f"🌐 API Success: {metrics['api_success_rate']:.1f}%")
             
-            return response
+            return "\n".join(parts)
             
         except Exception as e:
-            logger.error(f"Error in botstats command: {e}", exc_info=True)
+            _log_command_error("botstats", e)
             return "❌ Error fetching bot stats"
 
 
@@ -186,34 +243,36 @@ class ExportCommand(BaseCommand):
     name = "export"
     aliases = ["report", "sessionreport"]
     description = "Export current session analytics to file"
-    usage = "!export"
+    usage = "!export [pretty]"
     admin_only = True
     
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute export command"""
         if not context.is_admin():
             logger.warning(f"Admin check failed for {context.author}: admin_users={context.admin_users}")
-            return f"❌ Only admins can export analytics! Current admins: {', '.join(context.admin_users)}"
+            return f"❌ Only admins can export analytics! Current admins: {context.admin_users_str}"
         
         try:
-            analytics = get_analytics_tracker()
-            report = analytics.export_session_report()
+            analytics = _tracker()
+            # Flushes queued writes first, which can wait on the writer thread
+            report = await asyncio.to_thread(analytics.export_session_report)
             
             if not report:
                 return "❌ No active session to export"
             
-            # Create reports directory if it doesn't exist
-            reports_dir = "logs/session_reports"
-            os.makedirs(reports_dir, exist_ok=True)
-            
             # Generate filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"session_{timestamp}.json"
-            filepath = os.path.join(reports_dir, filename)
+            filepath = os.path.join(_REPORTS_DIR, filename)
             
-            # Write report to file
+            # Write report to file, compact unless "!export pretty"
+            arg = self.parse_first_arg(context.message)
+            if arg and arg.lower() == "pretty":
+                dump_options = {"indent": 2}
+            else:
+                dump_options = {"separators": (",", ":")}
             with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, default=str)
+                json.dump(report, f, default=str, ensure_ascii=False, **dump_options)
             
             logger.info(f"Session report exported to {filepath}")
             
@@ -223,14 +282,14 @@ class ExportCommand(BaseCommand):
             total_commands = session.get('total_commands', 0)
             peak_viewers = session.get('peak_viewers', 0)
             
-            response = f"📊 **Session Report Exported!**\n"
-            response += f"💬 {total_messages} messages\n"
-            response += f"⚡ {total_commands} commands\n"
-            response += f"👥 Peak: {peak_viewers} viewers\n"
-            response += f"📁 Saved: {filename}"
-            
-            return response
+            return "\n".join((
+                "📊 **Session Report Exported!**",
+                f"💬 {total_messages} messages",
+                f"⚡ {total_commands} commands",
+                f"👥 Peak: {peak_viewers} viewers",
+                f"📁 Saved: {filename}",
+            ))
             
         except Exception as e:
-            logger.error(f"Error in export command: {e}", exc_info=True)
+            _log_command_error("export", e)
             return "❌ Error exporting report"
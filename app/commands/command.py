@@ -3,8 +3,11 @@ Base command class and command context
 """
 
 import logging
-from typing import Optional, Dict, Any
+import sys
+import time
+from typing import Optional, Dict, Any, Iterable
 from abc import ABC, abstractmethod
+from functools import lru_cache
 try:
     from app.logger import get_logger
 except ModuleNotFoundError:
@@ -13,9 +16,20 @@ except ModuleNotFoundError:
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _format_admin_users(admin_users: frozenset) -> str:
+    """Sorted, comma-separated admin names for denial messages"""
+    return ", ".join(sorted(admin_users))
+
+
 class CommandContext:
     """Context passed to commands with necessary dependencies"""
     
+    # One context per chat command, so skip the per-instance __dict__
+    __slots__ = ("author", "message", "youtube_api", "streamer_profile",
+                 "current_game", "stream_topic", "admin_users", "timestamp",
+                 "command_name", "_arg_text", "_args")
+    
     def __init__(self, 
                  author: str,
                  message: str,
@@ -23,7 +37,7 @@ class CommandContext:
                  streamer_profile: Optional[Dict] = None,
                  current_game: Optional[str] = None,
                  stream_topic: Optional[str] = None,
-                 admin_users: Optional[list] = None):
+                 admin_users: Optional[Iterable[str]] = None):
         """
         Initialize command context
         
@@ -34,17 +48,48 @@ class CommandContext:
             streamer_profile: Streamer profile dictionary
             current_game: Currently playing game
             stream_topic: Stream topic if not gaming
-            admin_users: List of admin usernames (e.g., ['LokiVersee'])
+            admin_users: Admin usernames (e.g., ['LokiVersee']); a frozenset is
+                stored as-is so one set can be shared across messages
         """
-        import time
         self.author = author
         self.message = message
         self.youtube_api = youtube_api
         self.streamer_profile = streamer_profile or {}
         self.current_game = current_game
         self.stream_topic = stream_topic
-        self.admin_users = admin_users or []
+        if not isinstance(admin_users, frozenset):
+            admin_users = frozenset(admin_users or ())
+        self.admin_users = admin_users
         self.timestamp = time.time()
+        # Filled in by CommandParser once it has split off the command word
+        self.command_name: Optional[str] = None
+        self._arg_text: Optional[str] = None
+        self._args: Optional[list] = None
+    
+    @property
+    def admin_users_str(self) -> str:
+        """Admin names for display, formatted once per admin set"""
+        return _format_admin_users(self.admin_users)
+    
+    @property
+    def arg_text(self) -> str:
+        """Message text after the command word"""
+        if self._arg_text is None:
+            parts = self.message.split(None, 1)
+            self._arg_text = parts[1] if len(parts) > 1 else ""
+        return self._arg_text
+    
+    @arg_text.setter
+    def arg_text(self, value: str):
+        self._arg_text = value
+        self._args = None
+    
+    @property
+    def args(self) -> list:
+        """Whitespace-separated arguments after the command word, split on first use"""
+        if self._args is None:
+            self._args = self.arg_text.split()
+        return self._args
     
     def get(self, key: str, default: Any = None) -> Any:
         """Dictionary-like access to context"""
@@ -60,7 +105,8 @@ class CommandContext:
         
         if not is_admin:
             # Log debug info for troubleshooting
-            logger.debug(f"Admin check: author='{author_clean}' (original='{self.author}'), admin_users={self.admin_users}")
+            logger.debug("Admin check: author=%r (original=%r), admin_users=%r",
+                         author_clean, self.author, self.admin_users)
         
         return is_admin
 
@@ -88,6 +134,11 @@ class BaseCommand(ABC):
     
     def __init__(self):
         self.logger = get_logger(self.__class__.__name__)
+        # "!name" and "!alias" as typed in chat, lowercased and interned once
+        self.triggers: tuple = tuple(
+            sys.intern(f"!{trigger.lower()}") for trigger in (self.name, *self.aliases)
+        )
+        self._max_trigger_len = max(map(len, self.triggers))
     
     def can_handle(self, message: str) -> bool:
         """
@@ -97,19 +148,14 @@ class BaseCommand(ABC):
             message: Chat message to check
             
         Returns:
-            True if this command should handle this message
+            True if the message's first word is this command's name or an alias
         """
-        msg_lower = message.lower().strip()
-        
-        # Check if message starts with command name or alias
-        if msg_lower.startswith(f"!{self.name}"):
-            return True
-        
-        for alias in self.aliases:
-            if msg_lower.startswith(f"!{alias}"):
-                return True
+        # Only normalize enough of the message to compare against the triggers
+        parts = message.lstrip()[:self._max_trigger_len + 1].split(None, 1)
+        if not parts:
+            return False
         
-        return False
+        return parts[0].lower() in self.triggers
     
     def parse_args(self, message: str) -> list:
         """
@@ -121,11 +167,24 @@ class BaseCommand(ABC):
         Returns:
             List of arguments
         """
-        # Remove command prefix and split by whitespace
-        parts = message.strip().split()
-        if parts:
-            parts.pop(0)  # Remove command itself
-        return parts
+        # Drop the command itself, then split the rest by whitespace
+        parts = message.split(None, 1)
+        if len(parts) < 2:
+            return []
+        return parts[1].split()
+    
+    def parse_first_arg(self, message: str) -> Optional[str]:
+        """
+        Extract only the first argument from message
+        
+        Args:
+            message: Chat message
+            
+        Returns:
+            First argument, or None if there isn't one
+        """
+        parts = message.split(None, 2)
+        return parts[1] if len(parts) > 1 else None
     
     @abstractmethod
     async def execute(self, context: CommandContext) -> Optional[str]:
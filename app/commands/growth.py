@@ -3,6 +3,7 @@ Growth Features Commands
 Commands for managing subscriber goals, community challenges, etc.
 """
 
+from functools import lru_cache
 from typing import Optional
 from app.commands.command import BaseCommand, CommandContext
 
@@ -15,6 +16,22 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+_growth_features = None
+
+
+def _growth():
+    """Growth features singleton, looked up once per process"""
+    global _growth_features
+    if _growth_features is None:
+        _growth_features = get_growth_features()
+    return _growth_features
+
+
+@lru_cache(maxsize=4)
+def _supports_message_count(api_type: type) -> bool:
+    """Whether a YouTube API class can report the live chat message count"""
+    return hasattr(api_type, 'get_chat_message_count')
+
 
 class SetSubscriberGoalCommand(BaseCommand):
     """Set the subscriber goal target"""
@@ -27,29 +44,27 @@ class SetSubscriberGoalCommand(BaseCommand):
     
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute the command"""
-        if not context.message.startswith("!"):
-            return None
-        
         if not context.is_admin():
             logger.warning(f"Admin check failed for {context.author}: admin_users={context.admin_users}")
-            return f"❌ Only admins can set subscriber goals! Current admins: {', '.join(context.admin_users)}"
+            return f"❌ Only admins can set subscriber goals! Current admins: {context.admin_users_str}"
         
-        parts = context.message.split()
-        if len(parts) < 2:
+        arg = self.parse_first_arg(context.message)
+        if not arg:
             return "Usage: !setgoal <number> (e.g., !setgoal 100)"
         
-        try:
-            goal = int(parts[1])
-            if goal <= 0:
-                return "Goal must be a positive number!"
-            
-            growth = get_growth_features()
-            growth.set_subscriber_goal(goal)
-            
-            # Return the progress announcement immediately
-            return growth.get_subscriber_progress()
-        except ValueError:
-            return f"'{parts[1]}' is not a valid number!"
+        # Digits only, so a leading minus sign is rejected here too
+        if not arg.isdecimal():
+            return f"'{arg}' is not a valid number!"
+        
+        goal = int(arg)
+        if goal <= 0:
+            return "Goal must be a positive number!"
+        
+        growth = _growth()
+        growth.set_subscriber_goal(goal)
+        
+        # Return the progress announcement immediately
+        return growth.get_subscriber_progress()
 
 
 class StartChallengeCommand(BaseCommand):
@@ -63,29 +78,27 @@ class StartChallengeCommand(BaseCommand):
     
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute the command"""
-        if not context.message.startswith("!"):
-            return None
-        
         if not context.is_admin():
             logger.warning(f"Admin check failed for {context.author}: admin_users={context.admin_users}")
-            return f"❌ Only admins can start challenges! Current admins: {', '.join(context.admin_users)}"
+            return f"❌ Only admins can start challenges! Current admins: {context.admin_users_str}"
         
-        parts = context.message.split(maxsplit=2)
-        if len(parts) < 3:
+        # The reward text is everything after the count, so split only once
+        parts = context.arg_text.split(None, 1)
+        if len(parts) < 2:
             return "Usage: !challenge <message_count> <reward> (e.g., !challenge 500 play a raid)"
         
-        try:
-            message_target = int(parts[1])
-            reward_text = parts[2]
-            
-            if message_target <= 0:
-                return "Message count must be a positive number!"
-            
-            growth = get_growth_features()
-            response = growth.set_challenge(message_target, reward_text)
-            return response
-        except ValueError:
-            return f"'{parts[1]}' is not a valid number!"
+        if not parts[0].isdecimal():
+            return f"'{parts[0]}' is not a valid number!"
+        
+        message_target = int(parts[0])
+        reward_text = parts[1]
+        
+        if message_target <= 0:
+            return "Message count must be a positive number!"
+        
+        growth = _growth()
+        response = growth.set_challenge(message_target, reward_text)
+        return response
 
 
 class ViewGrowthStatsCommand(BaseCommand):
@@ -98,24 +111,16 @@ class ViewGrowthStatsCommand(BaseCommand):
     
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute the command"""
-        growth = get_growth_features()
+        growth = _growth()
         stats = growth.get_stats_summary()
         
-        lines = [
-            "📊 Growth Stats:",
-            f"  New Viewers: {stats['new_viewers_count']}",
-            f"  Active Chatters: {stats['active_viewers_count']}",
-        ]
-        
-        if stats['top_viewer']:
-            lines.append(f"  Top Chatter: {stats['top_viewer']}")
-        
-        lines.extend([
-            f"  Subscriber Goal: {stats['subscribers_remaining']} more to {stats['subscriber_goal']}",
+        top = f" |   Top Chatter: {stats['top_viewer']}" if stats['top_viewer'] else ""
+        return (
+            f"📊 Growth Stats: |   New Viewers: {stats['new_viewers_count']} | "
+            f"  Active Chatters: {stats['active_viewers_count']}{top} | "
+            f"  Subscriber Goal: {stats['subscribers_remaining']} more to {stats['subscriber_goal']} | "
             f"  Challenge Active: {'Yes' if stats['challenge_active'] else 'No'}"
-        ])
-        
-        return " | ".join(lines)
+        )
 
 
 class ChallengeProgressCommand(BaseCommand):
@@ -128,8 +133,9 @@ class ChallengeProgressCommand(BaseCommand):
     
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute the command"""
-        growth = get_growth_features()
-        message_count = context.youtube_api.get_chat_message_count() if hasattr(context.youtube_api, 'get_chat_message_count') else 0
+        growth = _growth()
+        api = context.youtube_api
+        message_count = api.get_chat_message_count() if _supports_message_count(type(api)) else 0
         
         progress = growth.check_challenge_progress(message_count)
         if progress:
@@ -150,9 +156,9 @@ class CancelChallengeCommand(BaseCommand):
         """Execute the command"""
         if not context.is_admin():
             logger.warning(f"Admin check failed for {context.author}: admin_users={context.admin_users}")
-            return f"❌ Only admins can cancel challenges! Current admins: {', '.join(context.admin_users)}"
+            return f"❌ Only admins can cancel challenges! Current admins: {context.admin_users_str}"
         
-        growth = get_growth_features()
+        growth = _growth()
         growth.challenge_active = False
         growth.save_config()
         return "Challenge cancelled!"
@@ -169,25 +175,19 @@ class SetCurrentSubscribersCommand(BaseCommand):
     
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute the command"""
-        if not context.message.startswith("!"):
-            return None
-        
         if not context.is_admin():
             logger.warning(f"Admin check failed for {context.author}: admin_users={context.admin_users}")
-            return f"❌ Only admins can set subscriber count! Current admins: {', '.join(context.admin_users)}"
+            return f"❌ Only admins can set subscriber count! Current admins: {context.admin_users_str}"
         
-        parts = context.message.split()
-        if len(parts) < 2:
+        arg = self.parse_first_arg(context.message)
+        if not arg:
             return "Usage: !setsubs <number> (e.g., !setsubs 60)"
         
-        try:
-            subscribers = int(parts[1])
-            if subscribers < 0:
-                return "Subscribers must be a non-negative number!"
-            
-            growth = get_growth_features()
-            growth.update_subscriber_count(subscribers)
-            remaining = max(0, growth.subscriber_goal - subscribers)
-            return f"👍 Current subscribers set to {subscribers}. {remaining} away from goal of {growth.subscriber_goal}!"
-        except ValueError:
-            return f"'{parts[1]}' is not a valid number!"
+        if not arg.isdecimal():
+            return f"'{arg}' is not a valid number!"
+        
+        subscribers = int(arg)
+        growth = _growth()
+        growth.update_subscriber_count(subscribers)
+        remaining = max(0, growth.subscriber_goal - subscribers)
+        return f"👍 Current subscribers set to {subscribers}. {remaining} away from goal of {growth.subscriber_goal}!"
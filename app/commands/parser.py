@@ -4,7 +4,7 @@ Routes messages to appropriate command handlers
 """
 
 import logging
-from typing import Optional, List
+from typing import Dict, Optional, List
 from .command import BaseCommand, CommandContext
 try:
     from app.logger import get_logger
@@ -21,6 +21,15 @@ class CommandParser:
         """Initialize command parser with empty command registry"""
         self.commands: dict = {}  # command_name -> command_instance
         self.command_list: List[BaseCommand] = []
+        # "!name" / "!alias" (lowercase) -> command_instance, first registration wins
+        self._dispatch: Dict[str, BaseCommand] = {}
+        # Longest trigger, so lookups only need to normalize that much of a message
+        self._max_trigger_len = 0
+        # Last message resolved, its command and the length of its command
+        # word; the bridge calls can_handle() then execute() on the same message
+        self._last_resolved: tuple = (None, None, 0)
+        # Deduplicated command_list, rebuilt after the next registration
+        self._unique_commands: Optional[List[BaseCommand]] = None
     
     def register(self, command: BaseCommand) -> None:
         """
@@ -36,6 +45,12 @@ class CommandParser:
         for alias in command.aliases:
             self.commands[alias] = command
         
+        for trigger in command.triggers:
+            self._dispatch.setdefault(trigger, command)
+            self._max_trigger_len = max(self._max_trigger_len, len(trigger))
+        self._last_resolved = (None, None, 0)
+        self._unique_commands = None
+        
         logger.debug(f"Registered command: !{command.name}")
     
     def get_command(self, command_name: str) -> Optional[BaseCommand]:
@@ -50,6 +65,27 @@ class CommandParser:
         """
         return self.commands.get(command_name)
     
+    def _resolve(self, message: str) -> Optional[BaseCommand]:
+        """
+        Look up the command invoked by a message's first word
+        
+        Args:
+            message: Chat message
+            
+        Returns:
+            Command instance or None if the first word isn't a registered trigger
+        """
+        last_message, last_command, _ = self._last_resolved
+        if message is last_message:
+            return last_command
+        
+        # A first word longer than every trigger can't match, so one extra
+        # character is enough to tell and the rest of the message is never copied
+        parts = message[:self._max_trigger_len + 1].split(None, 1)
+        command = self._dispatch.get(parts[0].lower()) if parts else None
+        self._last_resolved = (message, command, len(parts[0]) if parts else 0)
+        return command
+    
     def is_command(self, message: str) -> bool:
         """
         Check if this message looks like a command format
@@ -75,12 +111,7 @@ class CommandParser:
         if not message.startswith("!"):
             return False
         
-        # Check if any command can handle this
-        for command in self.command_list:
-            if command.can_handle(message):
-                return True
-        
-        return False
+        return self._resolve(message) is not None
     
     async def execute(self, message: str, context: CommandContext) -> Optional[str]:
         """
@@ -97,29 +128,33 @@ class CommandParser:
             return None
         
         # Find matching command
-        for command in self.command_list:
-            if command.can_handle(message):
-                try:
-                    logger.debug(f"Executing command for {context.author}: {message[:50]}...")
-                    response = await command.execute(context)
-                    if response:
-                        logger.debug(f"Command response: {response[:60]}...")
-                    return response
-                except Exception as e:
-                    logger.error(f"Error executing command {command.name}: {e}", exc_info=True)
-                    return f"Error executing command: {str(e)[:50]}"
+        command = self._resolve(message)
+        if command is None:
+            logger.debug(f"Unknown command: {message.split()[0]}")
+            return None
+        
+        # The command word's length is known from resolving it, so the
+        # arguments are a slice rather than a split of the whole message
+        word_len = self._last_resolved[2]
+        context.command_name = command.name
+        context.arg_text = message[word_len:].lstrip()
         
-        # No matching command
-        logger.debug(f"Unknown command: {message.split()[0]}")
-        return None
+        try:
+            logger.debug(f"Executing command for {context.author}: {message[:50]}...")
+            response = await command.execute(context)
+            if response:
+                logger.debug(f"Command response: {response[:60]}...")
+            return response
+        except Exception as e:
+            logger.error(f"Error executing command {command.name}: {e}", exc_info=True)
+            return f"Error executing command: {str(e)[:50]}"
     
     def get_all_commands(self) -> List[BaseCommand]:
         """Get list of all registered commands"""
-        # Remove duplicates (aliases)
-        seen = set()
-        unique_commands = []
-        for cmd in self.command_list:
-            if cmd.name not in seen:
-                seen.add(cmd.name)
-                unique_commands.append(cmd)
-        return unique_commands
+        if self._unique_commands is None:
+            # Remove duplicates (aliases), keeping the first registration per name
+            unique = {}
+            for cmd in self.command_list:
+                unique.setdefault(cmd.name, cmd)
+            self._unique_commands = list(unique.values())
+        return self._unique_commands
@@ -8,24 +8,44 @@ import logging
 try:
     from app.logger import get_logger
     from app.valorant_api import get_valorant_api
+    from app.constants import VALORANT_AGENTS
 except ModuleNotFoundError:
     from logger import get_logger
     from valorant_api import get_valorant_api
+    from constants import VALORANT_AGENTS
 
 logger = get_logger(__name__)
 
+_AGENTS_DISPLAY = ", ".join(agent.capitalize() for agent in VALORANT_AGENTS)
+
+# Agent info database (simplified)
+_AGENT_INFO = {
+    "reyna": "Reyna (Duelist) - Aggressive player with abilities to heal and dismiss herself",
+    "jett": "Jett (Duelist) - Fast, mobile agent with dash and projectile abilities",
+    "phoenix": "Phoenix (Duelist) - Utility-focused duelist with fire abilities",
+    "sage": "Sage (Sentinel) - Support/healer with slow orb and resurrection",
+    "omen": "Omen (Controller) - Smoke controller with shadow abilities",
+}
+
+_MAPS = ("Ascent", "Bind", "Haven", "Split", "Icebox", "Breeze", "Fracture", "Pearl", "Sunset")
+_MAPS_DISPLAY = ", ".join(_MAPS)
+_MAPS_LOWER = frozenset(m.lower() for m in _MAPS)
+
+# First words that list everything instead of naming one agent/map
+_LIST_ARGS = frozenset(("list", "all"))
+
 
 class ValorantStatsCommand(BaseCommand):
     """Query Valorant player stats"""
     
     name = "val"
-    aliases = ["valorant", "stats"]
+    aliases = ["valorant"]
     description = "Get Valorant stats: !val username#TAG [region] or !val stats/rank [username#TAG] [region]"
     usage = "!val Player#123 or !val Player#123 na (regions: na, eu, ap, latam, br, kr)"
     
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute valorant stats command"""
-        args = self.parse_args(context.message)
+        args = context.args
         
         if not args:
             return "Usage: !val username#TAG [region] | Regions: na, eu, ap, latam, br, kr"
@@ -114,19 +134,22 @@ class ValorantStatsCommand(BaseCommand):
                 total_matches = 0
                 wins = 0
                 
+                username_lower = username.lower()
                 for match in match_data:
-                    players = match.get("players", {}).get("all_players", [])
+                    players = (match.get("players") or {}).get("all_players")
+                    if not players:
+                        continue
                     for player in players:
-                        if player.get("name", "").lower() == username.lower():
-                            stats = player.get("stats", {})
+                        if player.get("name", "").lower() == username_lower:
+                            stats = player.get("stats") or {}
                             total_kills += stats.get("kills", 0)
                             total_deaths += stats.get("deaths", 0)
                             total_matches += 1
                             
                             # Check if won
                             team = player.get("team", "").lower()
-                            teams = match.get("teams", {})
-                            if team in teams and teams[team].get("has_won", False):
+                            team_result = (match.get("teams") or {}).get(team)
+                            if team_result and team_result.get("has_won", False):
                                 wins += 1
                             break
                 
@@ -157,30 +180,17 @@ class ValorantAgentCommand(BaseCommand):
     
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute agent info command"""
-        args = self.parse_args(context.message)
-        
-        if not args or args[0].lower() in ["list", "all"]:
-            agents = [
-                "Reyna", "Jett", "Phoenix", "Sage", "Omen", "Brimstone",
-                "Cypher", "Killjoy", "Viper", "Sova", "Yoru", "Astra",
-                "Skye", "Chamber", "Neon", "Fade", "Gekko", "Harbor", "Iso", "Clove"
-            ]
-            return f"Valorant agents: {', '.join(agents)}"
+        arg = self.parse_first_arg(context.message)
         
-        agent_name = args[0].lower()
+        if not arg or arg.lower() in _LIST_ARGS:
+            return f"Valorant agents: {_AGENTS_DISPLAY}"
         
-        # Agent info database (simplified)
-        agent_info = {
-            "reyna": "Reyna (Duelist) - Aggressive player with abilities to heal and dismiss herself",
-            "jett": "Jett (Duelist) - Fast, mobile agent with dash and projectile abilities",
-            "phoenix": "Phoenix (Duelist) - Utility-focused duelist with fire abilities",
-            "sage": "Sage (Sentinel) - Support/healer with slow orb and resurrection",
-            "omen": "Omen (Controller) - Smoke controller with shadow abilities",
-        }
+        agent_name = arg.lower()
         
-        if agent_name in agent_info:
+        info = _AGENT_INFO.get(agent_name)
+        if info:
             logger.debug(f"Agent info requested: {agent_name}")
-            return agent_info[agent_name]
+            return info
         else:
             return f"Agent '{agent_name}' not found. Use !agents for full list."
 
@@ -195,16 +205,14 @@ class ValorantMapCommand(BaseCommand):
     
     async def execute(self, context: CommandContext) -> Optional[str]:
         """Execute map command"""
-        args = self.parse_args(context.message)
-        
-        maps = ["Ascent", "Bind", "Haven", "Split", "Icebox", "Breeze", "Fracture", "Pearl", "Sunset"]
+        arg = self.parse_first_arg(context.message)
         
-        if not args or args[0].lower() in ["list", "all"]:
-            return f"Valorant maps: {', '.join(maps)}"
+        if not arg or arg.lower() in _LIST_ARGS:
+            return f"Valorant maps: {_MAPS_DISPLAY}"
         
-        requested_map = args[0].lower()
-        if any(m.lower() == requested_map for m in maps):
+        requested_map = arg.lower()
+        if requested_map in _MAPS_LOWER:
             logger.debug(f"Map info requested: {requested_map}")
             return f"Map: {requested_map.capitalize()} - Try !map [map_name] for strategies"
         else:
-            return f"Map '{requested_map}' not found. Available: {', '.join(maps)}"
+            return f"Map '{requested_map}' not found. Available: {_MAPS_DISPLAY}"
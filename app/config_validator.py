@@ -10,29 +10,42 @@ from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+# Riot ID: 1-16 alphanumeric name, '#', 1-5 alphanumeric tag
+_VALORANT_ID_RE = re.compile(r'[a-zA-Z0-9]{1,16}#[a-zA-Z0-9]{1,5}')
+
+_dotenv_loaded = False
+
+def _load_dotenv_once():
+    """Read .env into the environment the first time it's needed"""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
 def validate_api_keys():
     """Validate that required API keys are present"""
-    load_dotenv()
+    _load_dotenv_once()
+    env = os.environ
     
     errors = []
     warnings = []
     
     # YouTube API Key
-    youtube_key = os.getenv('YOUTUBE_API_KEY')
+    youtube_key = env.get('YOUTUBE_API_KEY')
     if not youtube_key:
         errors.append("❌ YOUTUBE_API_KEY not found in .env")
     else:
         logger.info("✅ YOUTUBE_API_KEY found")
     
     # Google API Key (Gemini)
-    google_key = os.getenv('GOOGLE_API_KEY') or os.getenv('GENAI_API_KEY') or os.getenv('GEMINI_API_KEY')
+    google_key = env.get('GOOGLE_API_KEY') or env.get('GENAI_API_KEY') or env.get('GEMINI_API_KEY')
     if not google_key:
         warnings.append("⚠️  No Gemini API key found (GOOGLE_API_KEY/GENAI_API_KEY/GEMINI_API_KEY). Agent will be disabled.")
     else:
         logger.info("✅ Gemini API key found")
     
     # Valorant API Key
-    henrik_key = os.getenv('HENRIK_DEV_API_KEY')
+    henrik_key = env.get('HENRIK_DEV_API_KEY')
     if not henrik_key:
         warnings.append("⚠️  HENRIK_DEV_API_KEY not found. Valorant stats will be unavailable.")
     else:
@@ -53,8 +66,7 @@ def validate_valorant_id(valorant_id: str) -> bool:
     if not valorant_id or "#" not in valorant_id:
         return False
     
-    pattern = r'^[a-zA-Z0-9]{1,16}#[a-zA-Z0-9]{1,5}$'
-    return bool(re.match(pattern, valorant_id))
+    return _VALORANT_ID_RE.fullmatch(valorant_id) is not None
 
 def validate_startup():
     """
@@ -18,6 +18,9 @@ SPECS_KEYWORDS = ["specs", "pc", "system", "gpu", "cpu", "ram", "setup", "config
 HELP_KEYWORDS = ["help", "madad", "question", "sawal", "puch"]
 QUESTION_MARKERS = ["?", "kya", "kaise", "kab", "kahan", "kyun", "what", "why", "how", "who", "when", "where"]
 
+# Valorant stats skill triggers: KD, aces, rank, last match, agent performance
+VALORANT_STATS_TRIGGERS = ["kd", "k/d", "aces", "rank", "last match", "stats", "valorant"]
+
 # Community engagement triggers
 COMMUNITY_TRIGGERS = ["love", "awesome", "great", "nice", "cool", "vibe", "fun", "enjoy", "favorite", "best", "amazing", "good map", "good game", "gg"]
 
@@ -4,21 +4,34 @@ Logging configuration for YouTube Chat Bot
 
 import logging
 import os
+from logging.handlers import MemoryHandler
 from datetime import datetime
 
-# Ensure logs directory exists
+# Ensure logs directory exists; it's a single level, so one mkdir does it
 LOG_DIR = "./logs"
-os.makedirs(LOG_DIR, exist_ok=True)
+try:
+    os.mkdir(LOG_DIR)
+except FileExistsError:
+    pass
 
 # Create log file with timestamp
 log_filename = os.path.join(LOG_DIR, f"bot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# The log file is only created on the first write, and records are buffered
+# so the file sees one write per batch; errors flush right away, and
+# logging.shutdown() flushes whatever is left at exit
+file_handler = logging.FileHandler(log_filename, encoding='utf-8', delay=True)
+file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+buffered_file_handler = MemoryHandler(1024, flushLevel=logging.ERROR, target=file_handler)
+
 # Configure root logger
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler(log_filename, encoding='utf-8'),
+        buffered_file_handler,
         logging.StreamHandler()
     ]
 )
@@ -0,0 +1,151 @@
+"""
+Streamer profile loading and first-time setup
+"""
+
+import json
+import os
+
+try:
+    import orjson  # Optional: faster profile load/save
+except ImportError:
+    orjson = None
+
+try:
+    from app.logger import get_logger
+except ModuleNotFoundError:
+    from logger import get_logger
+
+logger = get_logger(__name__)
+
+# Kept next to this module, independent of the working directory
+PROFILE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "streamer_profile.json")
+
+
+def save_streamer_profile(profile: dict) -> None:
+    """
+    Write the streamer profile to PROFILE_FILE
+
+    Args:
+        profile: Streamer profile dictionary
+    """
+    if orjson is not None:
+        with open(PROFILE_FILE, 'wb') as f:
+            f.write(orjson.dumps(profile, option=orjson.OPT_INDENT_2))
+    else:
+        with open(PROFILE_FILE, 'w') as f:
+            f.write(json.dumps(profile, indent=4))
+
+
+def get_streamer_profile():
+    """Load or create streamer profile"""
+    # Just try to open it; a missing file means this is the first run
+    try:
+        with open(PROFILE_FILE, 'rb') as f:
+            data = f.read()
+        profile = orjson.loads(data) if orjson is not None else json.loads(data)
+            
+        logger.info(f"Loaded profile from {PROFILE_FILE}")
+        logger.info(f"Profile contents: {json.dumps(profile, indent=2)}")
+        
+        # Backward compatibility check for Is Gaming
+        if 'Is Gaming' not in profile:
+            print("\n[Update] Stream Configuration")
+            is_gaming = input("Is this a gaming stream? (yes/no): ").strip().lower().startswith('y')
+            profile['Is Gaming'] = is_gaming
+            
+            if is_gaming:
+                if 'Valorant ID' not in profile:
+                    # Check if they play Valorant
+                    game = input("What game do you primarily play? ").strip()
+                    if 'valorant' in game.lower():
+                        profile['Valorant ID'] = input("Enter your Valorant ID (Name#Tag): ").strip()
+                        profile['Valorant Region'] = input("Enter your Valorant Region (ap, na, eu, kr, latam, br) [default: eu]: ").strip() or 'eu'
+            else:
+                if 'Stream Topic' not in profile:
+                    profile['Stream Topic'] = input("What is your usual stream topic? ").strip()
+            
+            save_streamer_profile(profile)
+                    
+        print(f"Loaded streamer profile for: {profile.get('Name', 'Unknown')}")
+        return profile
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error loading profile: {e}")
+    
+    print("\n" + "="*60)
+    print("FIRST TIME SETUP - STREAMER PROFILE")
+    print("="*60)
+    print("Please answer a few questions to personalize the bot for you.")
+    print("This information will be saved for future streams.\n")
+    
+    profile = {}
+    
+    env = os.environ
+    
+    # 1. Determine Stream Type
+    # Check if running in non-interactive mode (e.g. GitHub Actions)
+    if env.get('GITHUB_ACTIONS') == 'true':
+        print("Running in GitHub Actions - using default Valorant profile")
+        is_gaming = True
+        profile['Is Gaming'] = True
+        profile['Name'] = env.get('STREAMER_NAME', 'Streamer')
+        profile['Valorant ID'] = env.get('VALORANT_ID', '')
+        profile['Valorant Region'] = env.get('VALORANT_REGION', 'eu')
+        profile['System Specs'] = "Cloud Bot"
+        profile['Profession/Bio'] = "I am a bot running in the cloud!"
+        
+        # Add socials from environment if available
+        twitter = env.get('TWITTER_HANDLE')
+        instagram = env.get('INSTAGRAM_HANDLE')
+        discord = env.get('DISCORD_INVITE')
+        twitch = env.get('TWITCH_URL')
+        
+        if twitter:
+            profile['Twitter'] = twitter
+        if instagram:
+            profile['Instagram'] = instagram
+        if discord:
+            profile['Discord'] = discord
+        if twitch:
+            profile['Twitch'] = twitch
+        
+        # Save and return immediately
+        try:
+            save_streamer_profile(profile)
+            print("\nDefault profile saved successfully!")
+            return profile
+        except Exception as e:
+            print(f"Error saving profile: {e}")
+            return profile
+
+    is_gaming = input("Are you going to use this agent for a gaming stream? (yes/no): ").strip().lower().startswith('y')
+    profile['Is Gaming'] = is_gaming
+    
+    # 2. Collect Type-Specific Info
+    if is_gaming:
+        game = input("Which game will you be playing? ").strip()
+        if 'valorant' in game.lower():
+            print("Valorant detected! Let's set up your stats.")
+            profile['Valorant ID'] = input("What is your Valorant ID (Name#Tag)? (optional, press Enter to skip): ").strip()
+            if profile['Valorant ID']:
+                profile['Valorant Region'] = input("What is your Valorant Region (ap, na, eu, kr, latam, br) [default: eu]? ").strip() or 'eu'
+    else:
+        profile['Stream Topic'] = input("What will you be streaming? ").strip()
+        
+    # 3. General Info
+    profile['Name'] = input("What is your name/streamer name? ").strip()
+    profile['Location'] = input("Where are you from? (optional, press Enter to skip): ").strip()
+    
+    if is_gaming:
+        profile['System Specs'] = input("What are your system specs (CPU/GPU/RAM)? (optional, press Enter to skip): ").strip()
+        
+    profile['Profession/Bio'] = input("What do you do (Bio)? (optional, press Enter to skip): ").strip()
+    
+    try:
+        save_streamer_profile(profile)
+        print("\nProfile saved successfully!")
+    except Exception as e:
+        print(f"Error saving profile: {e}")
+        
+    return profile
@@ -7,8 +7,14 @@ import asyncio
 import os
 import sys
 import json
+from types import MappingProxyType
 from dotenv import load_dotenv
 
+try:
+    import uvloop  # Optional: faster event loop, not available on Windows
+except ImportError:
+    uvloop = None
+
 # Ensure imports work both when running from repo root and app folder
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 REPO_ROOT = os.path.dirname(BASE_DIR)
@@ -20,15 +26,15 @@ if BASE_DIR not in sys.path:
 # Import logging first
 from logger import get_logger
 from config_validator import validate_startup
+from profile_loader import get_streamer_profile
 from constants import STREAMER_PROFILE_FILE
 
 logger = get_logger(__name__)
 
 from youtube_integration.chat_bridge import run_youtube_chat_bot
 
-# Use relative path for profile file
+# Use relative path for admin config file
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-PROFILE_FILE = os.path.join(BASE_DIR, "streamer_profile.json")
 ADMIN_CONFIG_FILE = os.path.join(BASE_DIR, "admin_config.json")
 
 def get_admin_users():
@@ -44,118 +50,6 @@ def get_admin_users():
             logger.warning(f"Error loading admin config: {e}")
     return []
 
-def get_streamer_profile():
-    """Load or create streamer profile"""
-    if os.path.exists(PROFILE_FILE):
-        try:
-            with open(PROFILE_FILE, 'r') as f:
-                profile = json.load(f)
-                
-            logger.info(f"Loaded profile from {PROFILE_FILE}")
-            logger.info(f"Profile contents: {json.dumps(profile, indent=2)}")
-            
-            # Backward compatibility check for Is Gaming
-            if 'Is Gaming' not in profile:
-                print("\n[Update] Stream Configuration")
-                is_gaming = input("Is this a gaming stream? (yes/no): ").strip().lower().startswith('y')
-                profile['Is Gaming'] = is_gaming
-                
-                if is_gaming:
-                    if 'Valorant ID' not in profile:
-                        # Check if they play Valorant
-                        game = input("What game do you primarily play? ").strip()
-                        if 'valorant' in game.lower():
-                            profile['Valorant ID'] = input("Enter your Valorant ID (Name#Tag): ").strip()
-                            profile['Valorant Region'] = input("Enter your Valorant Region (ap, na, eu, kr, latam, br) [default: eu]: ").strip() or 'eu'
-                else:
-                    if 'Stream Topic' not in profile:
-                        profile['Stream Topic'] = input("What is your usual stream topic? ").strip()
-                
-                with open(PROFILE_FILE, 'w') as f_out:
-                    json.dump(profile, f_out, indent=4)
-                        
-            print(f"Loaded streamer profile for: {profile.get('Name', 'Unknown')}")
-            return profile
-        except Exception as e:
-            print(f"Error loading profile: {e}")
-    
-    print("\n" + "="*60)
-    print("FIRST TIME SETUP - STREAMER PROFILE")
-    print("="*60)
-    print("Please answer a few questions to personalize the bot for you.")
-    print("This information will be saved for future streams.\n")
-    
-    profile = {}
-    
-    # 1. Determine Stream Type
-    # Check if running in non-interactive mode (e.g. GitHub Actions)
-    if os.environ.get('GITHUB_ACTIONS') == 'true':
-        print("Running in GitHub Actions - using default Valorant profile")
-        is_gaming = True
-        profile['Is Gaming'] = True
-        profile['Name'] = os.environ.get('STREAMER_NAME', 'Streamer')
-        profile['Valorant ID'] = os.environ.get('VALORANT_ID', '')
-        profile['Valorant Region'] = os.environ.get('VALORANT_REGION', 'eu')
-        profile['System Specs'] = "Cloud Bot"
-        profile['Profession/Bio'] = "I am a bot running in the cloud!"
-        
-        # Add socials from environment if available
-        twitter = os.environ.get('TWITTER_HANDLE')
-        instagram = os.environ.get('INSTAGRAM_HANDLE')
-        discord = os.environ.get('DISCORD_INVITE')
-        twitch = os.environ.get('TWITCH_URL')
-        
-        if twitter:
-            profile['Twitter'] = twitter
-        if instagram:
-            profile['Instagram'] = instagram
-        if discord:
-            profile['Discord'] = discord
-        if twitch:
-            profile['Twitch'] = twitch
-        
-        # Save and return immediately
-        try:
-            with open(PROFILE_FILE, 'w') as f:
-                json.dump(profile, f, indent=4)
-            print("\nDefault profile saved successfully!")
-            return profile
-        except Exception as e:
-            print(f"Error saving profile: {e}")
-            return profile
-
-    is_gaming = input("Are you going to use this agent for a gaming stream? (yes/no): ").strip().lower().startswith('y')
-    profile['Is Gaming'] = is_gaming
-    
-    # 2. Collect Type-Specific Info
-    if is_gaming:
-        game = input("Which game will you be playing? ").strip()
-        if 'valorant' in game.lower():
-            print("Valorant detected! Let's set up your stats.")
-            profile['Valorant ID'] = input("What is your Valorant ID (Name#Tag)? (optional, press Enter to skip): ").strip()
-            if profile['Valorant ID']:
-                profile['Valorant Region'] = input("What is your Valorant Region (ap, na, eu, kr, latam, br) [default: eu]? ").strip() or 'eu'
-    else:
-        profile['Stream Topic'] = input("What will you be streaming? ").strip()
-        
-    # 3. General Info
-    profile['Name'] = input("What is your name/streamer name? ").strip()
-    profile['Location'] = input("Where are you from? (optional, press Enter to skip): ").strip()
-    
-    if is_gaming:
-        profile['System Specs'] = input("What are your system specs (CPU/GPU/RAM)? (optional, press Enter to skip): ").strip()
-        
-    profile['Profession/Bio'] = input("What do you do (Bio)? (optional, press Enter to skip): ").strip()
-    
-    try:
-        with open(PROFILE_FILE, 'w') as f:
-            json.dump(profile, f, indent=4)
-        print("\nProfile saved successfully!")
-    except Exception as e:
-        print(f"Error saving profile: {e}")
-        
-    return profile
-
 def main():
     """Main entry point"""
     # Validate configuration at startup
@@ -166,16 +60,19 @@ def main():
     
     # Load environment variables
     load_dotenv()
+    env = os.environ
+    # Non-interactive run (e.g. GitHub Actions): use defaults instead of prompting
+    in_github_actions = env.get('GITHUB_ACTIONS') == 'true'
     
     # Get configuration from environment or prompt user
-    youtube_api_key = os.getenv('YOUTUBE_API_KEY')
-    video_id = os.getenv('YOUTUBE_VIDEO_ID')
-    agent_name = os.getenv('AGENT_NAME', 'youtube_chat_advanced')
+    youtube_api_key = env.get('YOUTUBE_API_KEY')
+    video_id = env.get('YOUTUBE_VIDEO_ID')
+    agent_name = env.get('AGENT_NAME', 'youtube_chat_advanced')
     # Optional: allow disabling LLM agent when key issues occur
-    enable_agent = os.getenv('ENABLE_AGENT', 'true').strip().lower()
+    enable_agent = env.get('ENABLE_AGENT', 'true').strip().lower()
 
     # Surface Gemini key presence for troubleshooting (masked)
-    google_api_key = os.getenv('GOOGLE_API_KEY') or os.getenv('GENAI_API_KEY') or os.getenv('GEMINI_API_KEY')
+    google_api_key = env.get('GOOGLE_API_KEY') or env.get('GENAI_API_KEY') or env.get('GEMINI_API_KEY')
     if google_api_key:
         logger.info("Gemini key detected (env): ****" + google_api_key[-4:])
     else:
@@ -213,8 +110,9 @@ def main():
             logger.error("Please provide YOUTUBE_VIDEO_ID in .env file")
             return
     
-    # Get Streamer Profile
-    streamer_profile = get_streamer_profile()
+    # Get Streamer Profile (read-only from here on; the bridge, commands and
+    # skills all share this one mapping)
+    streamer_profile = MappingProxyType(get_streamer_profile())
     logger.info(f"Streamer profile loaded for: {streamer_profile.get('Name', 'Unknown')}")
     
     # Get Admin Users
@@ -228,7 +126,7 @@ def main():
     stream_topic = None
     
     if streamer_profile.get('Is Gaming', True):
-        if os.environ.get('GITHUB_ACTIONS') == 'true':
+        if in_github_actions:
             current_game = "Valorant"
         else:
             current_game = input("What game are you playing today? ").strip()
@@ -239,16 +137,16 @@ def main():
         logger.info(f"Topic: {stream_topic}")
     
     # Get Bot Name
-    default_bot_name = os.environ.get('BOT_NAME', 'StreamNova')
-    if os.environ.get('GITHUB_ACTIONS') == 'true':
+    default_bot_name = env.get('BOT_NAME', 'StreamNova')
+    if in_github_actions:
         bot_name = default_bot_name
     else:
         bot_name = input(f"What is your bot's name? [{default_bot_name}]: ").strip() or default_bot_name
     logger.info(f"Bot Name: {bot_name}")
     
     # Get Bot Username (signature for responses)
-    default_bot_username = os.environ.get('BOT_USERNAME', default_bot_name)
-    if os.environ.get('GITHUB_ACTIONS') == 'true':
+    default_bot_username = env.get('BOT_USERNAME', default_bot_name)
+    if in_github_actions:
         bot_username = default_bot_username
     else:
         bot_username = input(f"What username should the bot use in chat messages? [{default_bot_username}]: ").strip() or default_bot_username
@@ -274,16 +172,20 @@ def main():
     # Run the bot
     try:
         # Run continuously - GitHub Actions workflow will handle timeouts
-        asyncio.run(run_youtube_chat_bot(
-            video_id=video_id,
-            agent_name=agent_name,
-            streamer_profile=streamer_profile,
-            current_game=current_game,
-            stream_topic=stream_topic,
-            bot_name=bot_name,
-            bot_username=bot_username,
-            admin_users=admin_users
-        ))
+        # Uses uvloop when installed, otherwise asyncio's default loop
+        # (the Proactor loop on Windows)
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(run_youtube_chat_bot(
+                video_id=video_id,
+                agent_name=agent_name,
+                streamer_profile=streamer_profile,
+                current_game=current_game,
+                stream_topic=stream_topic,
+                bot_name=bot_name,
+                bot_username=bot_username,
+                admin_users=admin_users
+            ))
         logger.info("\n\nBot completed - stream ended")
         return 0
     except KeyboardInterrupt:
@@ -1,12 +1,44 @@
+import importlib
+
 from .registry import SkillRegistry
 from .skills import BaseSkill
-from .cohost import AICoHostSkill
-from .hype import FunnyHypeSkill
-from .gaming import SmartGamingAssistantSkill
-from .growth import GrowthBoosterSkill
-from .greeting import GreetingSkill
-from .community import CommunityEngagementSkill
-from .valorant_stats import ValorantStatsSkill
+try:
+    from app.constants import VALORANT_STATS_TRIGGERS
+except ModuleNotFoundError:
+    from constants import VALORANT_STATS_TRIGGERS
+
+# Skill classes are imported on first access (PEP 562) so importing the
+# package doesn't pull in every skill module and its dependencies
+_LAZY_SKILLS = {
+    "AICoHostSkill": "cohost",
+    "FunnyHypeSkill": "hype",
+    "SmartGamingAssistantSkill": "gaming",
+    "GrowthBoosterSkill": "growth",
+    "GreetingSkill": "greeting",
+    "CommunityEngagementSkill": "community",
+    "ValorantStatsSkill": "valorant_stats",
+}
+
+# Skill name and trigger keywords for skills that SkillRegistry.register_lazy()
+# can register before their module is imported; the skill class uses the same
+# trigger list, so the two can't drift apart
+SKILL_INDEX = {
+    "ValorantStatsSkill": ("valorant_stats", VALORANT_STATS_TRIGGERS),
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_SKILLS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_SKILLS))
+
 
 __all__ = [
     "SkillRegistry",
@@ -18,4 +50,4 @@ __all__ = [
     "GreetingSkill",
     "CommunityEngagementSkill",
     "ValorantStatsSkill",
-]
\ No newline at end of file
+]
@@ -1,3 +1,4 @@
+import re
 from typing import Optional, Dict, Any
 from .skills import BaseSkill
 
@@ -6,13 +7,23 @@ class AICoHostSkill(BaseSkill):
     name = "ai_cohost"
     description = "Conversational co-host that adds context-aware replies."
 
-    def should_handle(self, author: str, message: str) -> bool:
-        triggers = ["cohost", "host", "topic", "what are we doing", "explain"]
-        return any(t in message.lower() for t in triggers)
+    # Whole words (with their common inflections), checked against the
+    # registry's token set for the message
+    TRIGGERS = frozenset({
+        "cohost", "cohosting", "host", "hosts", "hosted", "hosting",
+        "topic", "topics", "explain", "explains", "explained", "explaining",
+    })
+    # Multi-word triggers can't match a single token, so they keep a pattern
+    _PHRASES_RE = re.compile(re.escape("what are we doing"), re.IGNORECASE)
+
+    def should_handle(self, message: str, context: Dict[str, Any]) -> bool:
+        if not self.TRIGGERS.isdisjoint(context["_tokens"]):
+            return True
+        return self._PHRASES_RE.search(message) is not None
 
     async def handle(self, author: str, message: str, context: Dict[str, Any]) -> Optional[str]:
         # Lightweight persona-based response using existing agent instruction as streamer voice
-        streamer = context.get("streamer_profile", {}).get("Name", "the streamer")
+        streamer = context.get("streamer_name") or "the streamer"
         topic = context.get("current_game") or context.get("stream_topic")
         if topic:
             return f"Quick recap: We're live with {topic}. Stick around—I'll keep chat flowing while {streamer} focuses!"
@@ -1,48 +1,53 @@
+import itertools
+import random
+import re
 import time
 from typing import Optional, Dict, Any
 from .skills import BaseSkill
 
+# Rotated through in a shuffled order; {streamer} is filled in when sent
+_COMMENTS = (
+    "Love the energy in chat! You all make {streamer}'s stream awesome.",
+    "Chat is vibing—keep the good times rolling!",
+    "Great to see everyone enjoying the game together.",
+    "This community is the best—thanks for hanging out!",
+    "So many positive vibes here!",
+    "Favorite map discussions always get the chat going!",
+    "Glad to see everyone having fun!",
+)
+
+
 class CommunityEngagementSkill(BaseSkill):
     name = "community_engagement"
     description = "Joins positive chat discussions with friendly comments, but avoids spamming."
 
+    TRIGGERS = ["love", "awesome", "great", "nice", "cool", "vibe", "fun", "enjoy", "favorite", "best", "amazing", "good map", "good game", "gg"]
+    # One case-insensitive scan instead of testing each trigger
+    _TRIGGERS_RE = re.compile("|".join(map(re.escape, TRIGGERS)), re.IGNORECASE)
+
     def __init__(self, config=None):
         super().__init__(config)
         self._last_sent: float = 0
+        self._min_gap = int(self.config.get("min_gap_seconds", 120))
+        self._comments = itertools.cycle(random.sample(_COMMENTS, len(_COMMENTS)))
 
-    def should_handle(self, author: str, message: str) -> bool:
-        msg = message.lower().strip()
+    def should_handle(self, message: str, context: Dict[str, Any]) -> bool:
         # Trigger on general positive sentiment, not questions or commands
-        triggers = ["love", "awesome", "great", "nice", "cool", "vibe", "fun", "enjoy", "favorite", "best", "amazing", "good map", "good game", "gg"]
-        # Only trigger if not a question and not a command
-        if "?" in msg or msg.startswith("!"):
+        if "?" in message or message.lstrip().startswith("!"):
             return False
-        return any(t in msg for t in triggers)
+        return self._TRIGGERS_RE.search(message) is not None
 
     async def handle(self, author: str, message: str, context: Dict[str, Any]) -> Optional[str]:
         now = time.time()
-        min_gap = int(self.config.get("min_gap_seconds", 120))
-        if now - self._last_sent < min_gap:
+        if now - self._last_sent < self._min_gap:
             return None
-        # Check viewer count from context (if available)
+        # Check viewer count from the bridge's latest stats snapshot (if available)
         viewer_count = None
-        youtube_api = context.get("youtube_api")
-        if youtube_api:
-            stats = youtube_api.get_stream_stats()
-            if stats:
-                viewer_count = stats.get("viewer_count", None)
+        stats = context.get("stream_stats")
+        if stats:
+            viewer_count = stats.get("viewer_count", None)
         if viewer_count is not None and viewer_count <= 0:
             return None
         self._last_sent = now
-        streamer = context.get("streamer_profile", {}).get("Name", "the stream")
-        comments = [
-            f"Love the energy in chat! You all make {streamer}'s stream awesome.",
-            "Chat is vibing—keep the good times rolling!",
-            "Great to see everyone enjoying the game together.",
-            "This community is the best—thanks for hanging out!",
-            "So many positive vibes here!",
-            "Favorite map discussions always get the chat going!",
-            "Glad to see everyone having fun!",
-        ]
-        import random
-        return random.choice(comments)
\ No newline at end of file
+        streamer = context.get("streamer_name") or "the stream"
+        return next(self._comments).format(streamer=streamer)
\ No newline at end of file
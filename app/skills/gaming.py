@@ -6,22 +6,39 @@ class SmartGamingAssistantSkill(BaseSkill):
     name = "smart_gaming_assistant"
     description = "Answers quick gaming questions and shares tips; calls Valorant tool when relevant."
 
-    def should_handle(self, author: str, message: str) -> bool:
-        msg = message.lower()
-        return any(k in msg for k in ["settings", "sens", "crosshair", "rank", "kd", "rr", "valorant"]) or "tip" in msg
+    # Whole words (with their common inflections), checked against the
+    # registry's token set for the message
+    _STAT_WORDS = frozenset({"rank", "ranks", "ranked", "ranking", "kd", "kda", "kdr", "rr"})
+    TRIGGERS = _STAT_WORDS | frozenset({
+        "settings", "sens", "sensitivity", "crosshair", "crosshairs", "valorant", "tip", "tips",
+    })
+    # Tip topics in priority order, with the words that select each
+    _TOPICS = (
+        ("sens", frozenset({"sens", "sensitivity"})),
+        ("crosshair", frozenset({"crosshair", "crosshairs"})),
+        ("settings", frozenset({"settings"})),
+        ("tip", frozenset({"tip", "tips"})),
+    )
+    # Concise general tips; any other topic gets no reply
+    _REPLIES = {
+        "sens": "General tip: pick a sens you can track with; avoid changing mid-week—consistency beats micro-optimizing.",
+        "crosshair": "Try a simple crosshair (1-2 thickness, no outlines). Prioritize clarity over style—muscle memory wins.",
+        "settings": "Low shadows, high texture clarity, limit post-processing. Keep FPS stable > input latency matters.",
+        "tip": "Small tip: take 5s resets after bad rounds—breathing + plan beats tilt.",
+    }
 
-    async def handle(self, author: str, message: str, context: Dict[str, Any]) -> Optional[str]:
-        msg = message.lower()
-        # If Valorant stats requested, defer to main agent by returning None so default path handles it
-        if any(k in msg for k in ["rank", "kd", "rr"]) and "valorant" in msg:
+    def should_handle(self, message: str, context: Dict[str, Any]) -> Optional[str]:
+        # Returns the topic to answer, which handle() gets as context["_match"]
+        tokens = context["_tokens"]
+        if self.TRIGGERS.isdisjoint(tokens):
             return None
-        # Provide concise general tips
-        if "sens" in msg or "sensitivity" in msg:
-            return "General tip: pick a sens you can track with; avoid changing mid-week—consistency beats micro-optimizing."
-        if "crosshair" in msg:
-            return "Try a simple crosshair (1-2 thickness, no outlines). Prioritize clarity over style—muscle memory wins."
-        if "settings" in msg:
-            return "Low shadows, high texture clarity, limit post-processing. Keep FPS stable > input latency matters."
-        if "tip" in msg:
-            return "Small tip: take 5s resets after bad rounds—breathing + plan beats tilt."
-        return None
\ No newline at end of file
+        # If Valorant stats requested, defer to main agent: handle() returns None so default path handles it
+        if "valorant" in tokens and not self._STAT_WORDS.isdisjoint(tokens):
+            return "valorant_stats"
+        for topic, words in self._TOPICS:
+            if not words.isdisjoint(tokens):
+                return topic
+        return "other"
+
+    async def handle(self, author: str, message: str, context: Dict[str, Any]) -> Optional[str]:
+        return self._REPLIES.get(context.get("_match"))
@@ -1,4 +1,5 @@
 import logging
+import re
 from typing import Optional, Dict, Any
 from .skills import BaseSkill
 try:
@@ -15,31 +16,33 @@ class GreetingSkill(BaseSkill):
     name = "greeting"
     description = "Welcomes viewers who greet or say hello with a friendly message."
 
-    def should_handle(self, author: str, message: str) -> bool:
-        msg = message.lower().strip()
-        # Trigger if message is a greeting or starts with greeting word
-        return any(msg == g or msg.startswith(g + " ") for g in GREETING_WORDS)
+    # A greeting word that is the whole message or followed by a space
+    _GREETING_RE = re.compile(
+        "(" + "|".join(map(re.escape, GREETING_WORDS)) + r")(?: |\Z)", re.IGNORECASE
+    )
+    # Greeting word -> how the reply greets back
+    _GREET_BACK = {
+        "hello": "Hello",
+        "hi": "Hi",
+        "hey": "Hey",
+        "namaste": "Namaste",
+        "namaskar": "Namaskar",
+        "hii": "Hi",
+        "hlo": "Hello",
+    }
+
+    def should_handle(self, message: str, context: Dict[str, Any]) -> Optional[str]:
+        # Trigger if message is a greeting or starts with greeting word, and
+        # hand the greeting to mirror on to handle()
+        match = self._GREETING_RE.match(message.strip())
+        if match is None:
+            return None
+        return self._GREET_BACK.get(match.group(1).lower(), "Hello")
 
     async def handle(self, author: str, message: str, context: Dict[str, Any]) -> Optional[str]:
-        msg = message.strip()
-        # Mirror the greeting if present, otherwise default to Hello
-        lower = msg.lower()
-        greet_map = {
-            "hello": "Hello",
-            "hi": "Hi",
-            "hey": "Hey",
-            "namaste": "Namaste",
-            "namaskar": "Namaskar",
-            "hii": "Hi",
-            "hlo": "Hello",
-        }
-        greeting = "Hello"
-        for k, v in greet_map.items():
-            if lower.startswith(k):
-                greeting = v
-                break
-        streamer = context.get("streamer_profile", {}).get("Name", "the stream")
+        # Mirror the greeting matched in should_handle, otherwise default to Hello
+        greeting = context.get("_match") or "Hello"
         # Keep it short and welcoming
         response = f"{greeting} {author}! Welcome to the stream—glad you're here. Tag me with @StreamNova if you have any questions!"
-        logger.debug(f"Greeting skill triggered for {author}")
+        logger.debug("Greeting skill triggered for %s", author)
         return response
\ No newline at end of file
@@ -1,3 +1,5 @@
+import re
+import time
 from typing import Optional, Dict, Any
 from .skills import BaseSkill
 
@@ -6,22 +8,24 @@ class GrowthBoosterSkill(BaseSkill):
     name = "growth_booster"
     description = "Light CTA skill that reminds viewers to like/subscribe or share at tasteful intervals."
 
+    # Positive sentiment words
+    TRIGGERS = ["love", "awesome", "great", "nice", "good stream", "cool"]
+    _TRIGGERS_RE = re.compile("|".join(map(re.escape, TRIGGERS)), re.IGNORECASE)
+
     def __init__(self, config=None):
         super().__init__(config)
         self._last_ts: float | None = None
+        self._min_gap = int(self.config.get("min_gap_seconds", 120))
 
-    def should_handle(self, author: str, message: str) -> bool:
+    def should_handle(self, message: str, context: Dict[str, Any]) -> bool:
         # Trigger on positive sentiment words
-        triggers = ["love", "awesome", "great", "nice", "good stream", "cool"]
-        return any(t in message.lower() for t in triggers)
+        return self._TRIGGERS_RE.search(message) is not None
 
     async def handle(self, author: str, message: str, context: Dict[str, Any]) -> Optional[str]:
         # Rate limit via registry context clock
-        import time
         now = time.time()
-        min_gap = int(self.config.get("min_gap_seconds", 120))
-        if self._last_ts and (now - self._last_ts) < min_gap:
+        if self._last_ts and (now - self._last_ts) < self._min_gap:
             return None
         self._last_ts = now
-        streamer = context.get("streamer_profile", {}).get("Name", "the channel")
+        streamer = context.get("streamer_name") or "the channel"
         return f"If you’re enjoying, drop a like and consider subscribing to support {streamer}! 💙"
\ No newline at end of file
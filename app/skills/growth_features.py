@@ -3,8 +3,10 @@ Growth Features for YouTube Chat Bot
 Includes: New viewer welcome, subscriber goals, community challenges, viewer callouts
 """
 
+import atexit
 import json
 import os
+import threading
 import time
 import logging
 from datetime import datetime, timedelta
@@ -22,6 +24,9 @@ class GrowthFeatures:
     """Manages growth-focused features for stream engagement"""
     
     CONFIG_FILE = "growth_config.json"
+    # save_config() only marks the config dirty; a background thread writes
+    # it at most once per SAVE_INTERVAL_SECONDS, and flush() writes it now
+    SAVE_INTERVAL_SECONDS = 5.0
     
     @staticmethod
     def calculate_next_milestone(current_subs: int) -> int:
@@ -43,7 +48,7 @@ class GrowthFeatures:
             # Round up to next 50
             return ((current_subs // 50) + 1) * 50
     
-    def __init__(self, analytics_db=None):
+    def __init__(self, analytics=None):
         self.new_viewers = set()  # Track first-time chatters in current stream
         self.active_viewers = defaultdict(int)  # Track viewer message counts
         self.last_viewer_callout = 0  # Track last callout time
@@ -52,11 +57,20 @@ class GrowthFeatures:
         self.challenge_config = {}
         self.subscriber_goal = 100  # Default goal
         self.current_subscribers = 0
-        self.analytics_db = analytics_db  # Database reference for historical data
+        self.analytics = analytics  # Analytics tracker for historical viewer data
         
         # Load configuration if it exists
         self.load_config()
         
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        self._saver_thread = threading.Thread(
+            target=self._saver_loop, name="growth-config-writer", daemon=True
+        )
+        self._saver_thread.start()
+        # The saver is a daemon thread, so write anything pending on exit
+        atexit.register(self.flush)
+        
     def load_config(self):
         """Load growth features configuration"""
         if os.path.exists(self.CONFIG_FILE):
@@ -68,23 +82,44 @@ class GrowthFeatures:
                     self.current_subscribers = config.get('current_subscribers', config.get('current_followers', 0))
                     self.challenge_config = config.get('challenge', {})
                     # Note: new_viewers is not loaded - it's reset each stream
-                    logger.info(f"Loaded growth config: goal={self.subscriber_goal}, subscribers={self.current_subscribers}")
+                    logger.info("Loaded growth config: goal=%s, subscribers=%s", self.subscriber_goal, self.current_subscribers)
             except Exception as e:
-                logger.error(f"Error loading growth config: {e}")
+                logger.error("Error loading growth config: %s", e)
     
     def save_config(self):
-        """Save growth features configuration"""
-        try:
-            config = {
-                'subscriber_goal': self.subscriber_goal,
-                'current_subscribers': self.current_subscribers,
-                'challenge': self.challenge_config
-                # Note: new_viewers is not persisted - it's reset each stream
-            }
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving growth config: {e}")
+        """Mark the configuration changed; it's written by the saver thread"""
+        self._dirty = True
+    
+    def flush(self):
+        """Write the configuration now if it has unsaved changes"""
+        with self._save_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                config = {
+                    'subscriber_goal': self.subscriber_goal,
+                    'current_subscribers': self.current_subscribers,
+                    'challenge': self.challenge_config
+                    # Note: new_viewers is not persisted - it's reset each stream
+                }
+                # Encode first, write in one call, then swap the file in so
+                # a crash mid-write can't leave a truncated config behind
+                data = json.dumps(config)
+                tmp_file = self.CONFIG_FILE + '.tmp'
+                with open(tmp_file, 'w') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.CONFIG_FILE)
+            except Exception as e:
+                # Keep it pending so the next pass retries the write
+                self._dirty = True
+                logger.error("Error saving growth config: %s", e)
+    
+    def _saver_loop(self):
+        """Background thread: write pending config changes periodically"""
+        while True:
+            time.sleep(self.SAVE_INTERVAL_SECONDS)
+            self.flush()
     
     def reset_for_new_stream(self):
         """Reset state for a new stream session"""
@@ -99,7 +134,7 @@ class GrowthFeatures:
         """Set the subscriber goal target"""
         self.subscriber_goal = goal
         self.save_config()
-        logger.info(f"Subscriber goal set to {goal}")
+        logger.info("Subscriber goal set to %s", goal)
     
     def update_subscriber_count(self, current_subscribers: int, auto_set_goal: bool = True):
         """Update current subscriber count and optionally auto-set goal
@@ -117,24 +152,24 @@ class GrowthFeatures:
                 new_goal = self.calculate_next_milestone(current_subscribers)
                 if new_goal != self.subscriber_goal:
                     self.subscriber_goal = new_goal
-                    logger.info(f"Auto-set subscriber goal to {new_goal} based on current count {current_subscribers}")
+                    logger.info("Auto-set subscriber goal to %s based on current count %s", new_goal, current_subscribers)
             
             self.save_config()
-            logger.info(f"Updated subscriber count to {current_subscribers}")
+            logger.info("Updated subscriber count to %s", current_subscribers)
     
     def is_new_viewer(self, username: str) -> bool:
         """Check if viewer is chatting for first time in CURRENT stream"""
         is_new = username not in self.new_viewers
         if is_new:
             self.new_viewers.add(username)
-            logger.info(f"New viewer detected (this stream): {username}")
+            logger.info("New viewer detected (this stream): %s", username)
         return is_new
     
     def is_returning_viewer(self, username: str) -> bool:
         """Check if viewer has chatted in PAST streams"""
-        if not self.analytics_db:
+        if not self.analytics:
             return False
-        return self.analytics_db.is_returning_viewer(username)
+        return self.analytics.is_returning_viewer(username)
     
     def track_message(self, username: str):
         """Track viewer message for activity purposes"""
@@ -153,13 +188,12 @@ class GrowthFeatures:
     
     def get_returning_viewer_welcome(self, username: str) -> str:
         """Generate personalized welcome message for returning viewers"""
-        if not self.analytics_db:
+        if not self.analytics:
             return self.get_new_viewer_welcome(username)
         
         # Get viewer stats
-        stats = self.analytics_db.get_viewer_stats(username)
-        recent = self.analytics_db.get_most_recent_session_info(username)
-        days_ago = self.analytics_db.get_days_since_last_chat(username)
+        stats = self.analytics.db.get_viewer_stats(username, include_archive=True)
+        days_ago = self.analytics.get_days_since_last_chat(username)
         
         if not stats:
             return self.get_new_viewer_welcome(username)
@@ -230,7 +264,7 @@ class GrowthFeatures:
         }
         self.challenge_active = True
         self.save_config()
-        logger.info(f"Challenge set: {message_target} messages for '{reward_text}'")
+        logger.info("Challenge set: %s messages for '%s'", message_target, reward_text)
         return f"🎯 Community Challenge: If chat reaches {message_target} messages, {reward_text}! Let's go! 🔥"
     
     def check_challenge_progress(self, current_message_count: int) -> str:
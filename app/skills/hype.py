@@ -6,10 +6,10 @@ class FunnyHypeSkill(BaseSkill):
     name = "funny_hype"
     description = "Drops short hype lines and light jokes triggered by events."
 
-    def should_handle(self, author: str, message: str) -> bool:
+    def should_handle(self, message: str, context: Dict[str, Any]) -> bool:
         triggers = ["gg", "clutch", "win", "pog", "let's go", "fire", "insane"]
         stats_triggers = ["stats", "stream stats", "show stats", "!stats"]
-        msg_lower = message.lower().strip()
+        msg_lower = context["message_lower"].strip()
         # Hype triggers
         for t in triggers:
             if msg_lower == t or msg_lower.startswith(f"!{t}"):
@@ -22,7 +22,7 @@ class FunnyHypeSkill(BaseSkill):
 
     async def handle(self, author: str, message: str, context: Dict[str, Any]) -> Optional[str]:
         stats_triggers = ["stats", "stream stats", "show stats", "!stats"]
-        msg_lower = message.lower().strip()
+        msg_lower = context["message_lower"].strip()
         # Stats request
         for s in stats_triggers:
             if msg_lower == s or msg_lower.startswith(f"!{s}"):
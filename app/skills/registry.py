@@ -1,7 +1,40 @@
-from typing import List, Dict, Any
+import importlib
+import re
+from typing import List, Dict, Any, Iterable, Optional
 from .skills import BaseSkill
 
 
+# Words in a lowercased message, for skills that trigger on whole words
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class _LazySkill(BaseSkill):
+    """Stands in for a skill whose module is only imported once a message hits its triggers"""
+
+    def __init__(self, module_name: str, class_name: str, name: str, triggers: Iterable[str],
+                 config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        self.name = name
+        self._module_name = module_name
+        self._class_name = class_name
+        self._triggers_re = re.compile("|".join(map(re.escape, triggers)), re.IGNORECASE)
+        self._skill: Optional[BaseSkill] = None
+
+    def _load(self) -> BaseSkill:
+        if self._skill is None:
+            module = importlib.import_module(self._module_name, __package__)
+            self._skill = getattr(module, self._class_name)(self.config)
+        return self._skill
+
+    def should_handle(self, message: str, context: Dict[str, Any]) -> bool:
+        if self._skill is None and self._triggers_re.search(message) is None:
+            return False
+        return self._load().should_handle(message, context)
+
+    async def handle(self, author: str, message: str, context: Dict[str, Any]) -> Optional[str]:
+        return await self._load().handle(author, message, context)
+
+
 class SkillRegistry:
     def __init__(self):
         self._skills: List[BaseSkill] = []
@@ -9,15 +42,36 @@ class SkillRegistry:
     def register(self, skill: BaseSkill):
         self._skills.append(skill)
 
+    def register_lazy(self, class_name: str, config: Optional[Dict[str, Any]] = None):
+        """
+        Register a skill without importing its module yet
+
+        Args:
+            class_name: Skill class listed in SKILL_INDEX; its module is
+                imported the first time a message contains one of its triggers
+            config: Config passed to the skill when it's created
+        """
+        # Imported here because the package imports this module first
+        from . import SKILL_INDEX, _LAZY_SKILLS
+        name, triggers = SKILL_INDEX[class_name]
+        self._skills.append(
+            _LazySkill(f".{_LAZY_SKILLS[class_name]}", class_name, name, triggers, config)
+        )
+
     def list(self) -> List[BaseSkill]:
         return list(self._skills)
 
     async def dispatch(self, author: str, message: str, context: Dict[str, Any]) -> str | None:
+        # Lowercased and tokenized once here and shared by every skill via the context
+        message_lower = context["message_lower"] = message.lower()
+        context["_tokens"] = frozenset(_TOKEN_RE.findall(message_lower))
         for skill in self._skills:
             try:
-                if skill.should_handle(author, message):
+                match = skill.should_handle(message, context)
+                if match:
+                    context["_match"] = match
                     return await skill.handle(author, message, context)
             except Exception:
                 # Fail-safe: skip misbehaving skills
                 continue
-        return None
\ No newline at end of file
+        return None
@@ -8,8 +8,13 @@ class BaseSkill:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
 
-    def should_handle(self, author: str, message: str) -> bool:
+    # Runs for every chat message, so it only looks at the text. Any truthy
+    # result means "handle this"; the registry passes it on to handle() as
+    # context["_match"] so the message needn't be parsed twice
+    def should_handle(self, message: str, context: Dict[str, Any]) -> Any:
         return False
 
+    # Only called once the skill fires, so replies (and anything built from
+    # the author's name) are formatted here rather than in should_handle()
     async def handle(self, author: str, message: str, context: Dict[str, Any]) -> Optional[str]:
         return None
\ No newline at end of file
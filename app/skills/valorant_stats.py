@@ -1,55 +1,63 @@
 from typing import Optional, Dict, Any
 import logging
+import re
+from types import MappingProxyType
 try:
     from app.skills.skills import BaseSkill
     from app.tools.valorant import get_valorant_stats
-    from app.constants import VALORANT_AGENTS, VALORANT_ID_PATTERN
+    from app.constants import VALORANT_AGENTS, VALORANT_ID_PATTERN, VALORANT_STATS_TRIGGERS
     from app.utils.file_utils import save_stats_to_file
 except ModuleNotFoundError:
     from skills.skills import BaseSkill
     from tools.valorant import get_valorant_stats
-    from constants import VALORANT_AGENTS, VALORANT_ID_PATTERN
+    from constants import VALORANT_AGENTS, VALORANT_ID_PATTERN, VALORANT_STATS_TRIGGERS
     from utils.file_utils import save_stats_to_file
 
 logger = logging.getLogger(__name__)
 
+# Shared default, so a context without a profile doesn't allocate a new dict
+_NO_PROFILE = MappingProxyType({})
+
 class ValorantStatsSkill(BaseSkill):
     name = "valorant_stats"
     description = "Answers Valorant stat questions using the Valorant API."
 
-    def should_handle(self, author: str, message: str) -> bool:
-        msg = message.lower()
+    # Trigger on KD, aces, rank, last match, agent performance
+    TRIGGERS = VALORANT_STATS_TRIGGERS
+    _TRIGGERS_RE = re.compile("|".join(map(re.escape, TRIGGERS)), re.IGNORECASE)
+    # The bot's own Valorant stats replies
+    _OWN_REPLY_RE = re.compile("valorant stats for", re.IGNORECASE)
+
+    def should_handle(self, message: str, context: Dict[str, Any]) -> bool:
         # Ignore bot's own Valorant stats replies
-        if msg.startswith("valorant stats for"):
+        if self._OWN_REPLY_RE.match(message):
             return False
-        # Trigger on KD, aces, rank, last match, agent performance
-        triggers = ["kd", "k/d", "aces", "rank", "last match", "stats", "valorant"]
-        return any(t in msg for t in triggers)
+        return self._TRIGGERS_RE.search(message) is not None
 
     async def handle(self, author: str, message: str, context: Dict[str, Any]) -> Optional[str]:
-        profile = context.get("streamer_profile", {})
+        profile = context.get("streamer_profile", _NO_PROFILE)
         valorant_id = profile.get("Valorant ID", None)
         region = profile.get("Valorant Region", "eu")
         
-        logger.info(f"[ValorantStatsSkill] Profile Valorant ID: {valorant_id}, Region: {region}")
+        logger.info("[ValorantStatsSkill] Profile Valorant ID: %s, Region: %s", valorant_id, region)
         
         # Try to extract Valorant ID from message if present
-        msg = message.lower()
+        msg = context["message_lower"]
         match = VALORANT_ID_PATTERN.search(message)
         if match:
             username, tag = match.group(1), match.group(2)
-            logger.info(f"Extracted Valorant ID from message: {username}#{tag}")
+            logger.info("Extracted Valorant ID from message: %s#%s", username, tag)
         elif valorant_id and "#" in valorant_id:
             username, tag = valorant_id.split("#", 1)
-            logger.info(f"Using streamer's Valorant ID from profile: {username}#{tag}")
+            logger.info("Using streamer's Valorant ID from profile: %s#%s", username, tag)
         else:
-            logger.warning(f"No Valorant ID in message or profile. Profile ID = {valorant_id}")
+            logger.warning("No Valorant ID in message or profile. Profile ID = %s", valorant_id)
             return "Valorant ID not found. Use !val YourName#TAG or set streamer Valorant ID in profile."
         
         stats = None
         # KD or aces
         if "kd" in msg or "k/d" in msg:
-            logger.info(f"Fetching KD stats for {username}#{tag}")
+            logger.info("Fetching KD stats for %s#%s", username, tag)
             stats = get_valorant_stats(username, tag, region, query_type="summary")
         elif "aces" in msg:
             # For simplicity, use agent_performance for all agents (could be improved)
@@ -71,7 +79,7 @@ class ValorantStatsSkill(BaseSkill):
             # Save rank and last match to separate files
             if rank_line or last_match_line:
                 save_stats_to_file(rank_line or "", last_match_line or "")
-                logger.info(f"Saved Valorant stats for {username}#{tag} to files")
+                logger.info("Saved Valorant stats for %s#%s to files", username, tag)
             return stats
         elif "last match" in msg or "stats" in msg:
             full_stats = get_valorant_stats(username, tag, region, query_type="summary")
@@ -90,13 +98,13 @@ class ValorantStatsSkill(BaseSkill):
             # Save rank and last match to separate files
             if rank_line or last_match_line:
                 save_stats_to_file(rank_line or "", last_match_line or "")
-                logger.info(f"Saved Valorant stats for {username}#{tag} to files")
+                logger.info("Saved Valorant stats for %s#%s to files", username, tag)
             return stats
         else:
             # Agent performance (e.g., "Reyna stats")
             for agent in VALORANT_AGENTS:
                 if agent in msg:
                     stats = get_valorant_stats(username, tag, region, query_type="agent_performance", agent=agent.title())
-                    logger.info(f"Fetched agent stats for {agent} - {username}#{tag}")
+                    logger.info("Fetched agent stats for %s - %s#%s", agent, username, tag)
                     break
             return stats
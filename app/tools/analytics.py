@@ -88,11 +88,11 @@ def get_chat_analytics(
             
             result = "Recent stream sessions:\n"
             for session in sessions[:limit]:
-                start = session['start_time']
-                title = session['stream_title'] or "Untitled Stream"
-                messages = session['total_messages']
-                commands = session['total_commands']
-                viewers = session['peak_viewers']
+                start = session.start_time
+                title = session.stream_title or "Untitled Stream"
+                messages = session.total_messages
+                commands = session.total_commands
+                viewers = session.peak_viewers
                 
                 result += f"• {start} - {title}\n"
                 result += f"  {messages} messages, {commands} commands, peak {viewers} viewers\n"
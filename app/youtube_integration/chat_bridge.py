@@ -97,11 +97,12 @@ class YouTubeChatBridge:
         self.require_mention = require_mention  # More conservative response mode
         self.bot_name = bot_name  # Bot's unique name/persona
         self.bot_username = bot_username  # Customizable username signature for responses
-        self.admin_users = admin_users or []  # Admin user list
+        self.admin_users = frozenset(admin_users or ())  # Admin users, shared by every CommandContext
         self.is_running = False
 
         # Store context for skills
         self.streamer_profile = streamer_profile or {}
+        self.streamer_name = self.streamer_profile.get("Name")  # None if not set
         self.current_game = current_game
         self.stream_topic = stream_topic
 
@@ -112,8 +113,9 @@ class YouTubeChatBridge:
         self.skills.register(CommunityEngagementSkill({"min_gap_seconds": 180}))
         self.skills.register(AICoHostSkill())
         self.skills.register(FunnyHypeSkill())
-        from app.skills import ValorantStatsSkill
-        self.skills.register(ValorantStatsSkill())
+        # Imported on the first message that mentions Valorant stats, which
+        # pulls in the API client
+        self.skills.register_lazy("ValorantStatsSkill")
         self.skills.register(SmartGamingAssistantSkill())
         self.skills.register(GrowthBoosterSkill({"min_gap_seconds": 180}))
         logger.debug(f"Registered {len(self.skills.list())} skills")
@@ -176,10 +178,14 @@ class YouTubeChatBridge:
         self.analytics = get_analytics_tracker()
         self.viewer_snapshot_interval = 60  # Track viewers every 60 seconds
         self.last_viewer_snapshot = 0
+        self.db_maintenance_interval = 86400  # ANALYZE + WAL truncate once a day
+        self.last_db_maintenance = time.time()
+        self.last_archive_month = None  # Old messages are archived once a month
+        self.stream_stats = None  # Latest snapshot, shared with skills via their context
         
-        # Growth features - pass analytics database for historical viewer data
+        # Growth features - pass the analytics tracker for historical viewer data
         self.growth = get_growth_features()
-        self.growth.analytics_db = self.analytics.db  # Pass database reference for historical queries
+        self.growth.analytics = self.analytics  # Tracker memoizes per-viewer lookups for the session
         self.growth_feature_interval = 30  # Check growth features every 30 seconds
         self.last_growth_check = 0
         
@@ -363,126 +369,147 @@ class YouTubeChatBridge:
         last_stream_check = time.time()
         stream_check_interval = 60  # Check every 60 seconds
         
-        # Main loop
-        while self.is_running and chat.is_alive():
-            try:
-                # Check if stream is still active periodically
-                current_time = time.time()
-                if current_time - last_stream_check >= stream_check_interval:
-                    if not self.youtube.is_stream_active(self.video_id):
-                        logger.info("Stream has ended - stopping bot gracefully")
-                        self.is_running = False
-                        break
-                    last_stream_check = current_time
-                
-                # Check for periodic growth feature announcements
-                if current_time - self.last_growth_check >= self.growth_feature_interval:
-                    self.last_growth_check = current_time
+        # The shutdown steps run in the finally block so a cancelled run
+        # (Ctrl+C, workflow timeout) still saves its analytics
+        try:
+            # Main loop
+            while self.is_running and chat.is_alive():
+                try:
+                    # Check if stream is still active periodically
+                    current_time = time.time()
+                    if current_time - last_stream_check >= stream_check_interval:
+                        if not self.youtube.is_stream_active(self.video_id):
+                            logger.info("Stream has ended - stopping bot gracefully")
+                            self.is_running = False
+                            break
+                        last_stream_check = current_time
                     
-                    # Check for subscriber goal progress announcement (every 30 minutes)
-                    if self.growth.should_announce_subscriber_progress(announcement_interval_minutes=30):
-                        progress_msg = self.growth.get_subscriber_progress()
-                        try:
-                            msg_id = self.youtube.post_message(progress_msg)
-                            if msg_id:
-                                self.processed_messages.add(msg_id)
-                                self.save_message_id(msg_id)
-                                self.recent_bot_messages.append(self._normalize_text(progress_msg))
-                                logger.info(f"[SUBSCRIBER PROGRESS]: {progress_msg}")
-                        except Exception as e:
-                            logger.warning(f"Failed to post subscriber progress: {e}")
+                    # Check for periodic growth feature announcements
+                    if current_time - self.last_growth_check >= self.growth_feature_interval:
+                        self.last_growth_check = current_time
+                        
+                        # Check for subscriber goal progress announcement (every 30 minutes)
+                        if self.growth.should_announce_subscriber_progress(announcement_interval_minutes=30):
+                            progress_msg = self.growth.get_subscriber_progress()
+                            try:
+                                msg_id = self.youtube.post_message(progress_msg)
+                                if msg_id:
+                                    self.processed_messages.add(msg_id)
+                                    self.save_message_id(msg_id)
+                                    self.recent_bot_messages.append(self._normalize_text(progress_msg))
+                                    logger.info(f"[SUBSCRIBER PROGRESS]: {progress_msg}")
+                            except Exception as e:
+                                logger.warning(f"Failed to post subscriber progress: {e}")
+                        
+                        # Check for viewer callout (excluding admins) - SUPPRESSED
+                        # if self.growth.should_do_viewer_callout(callout_interval_minutes=30):
+                        #     callout_msg = self.growth.get_active_viewer_callout(admin_users=self.admin_users)
+                        #     if callout_msg:
+                        #         try:
+                        #             msg_id = self.youtube.post_message(callout_msg)
+                        #             if msg_id:
+                        #                 self.processed_messages.add(msg_id)
+                        #                 self.save_message_id(msg_id)
+                        #                 self.recent_bot_messages.append(self._normalize_text(callout_msg))
+                        #                 logger.info(f"[VIEWER CALLOUT]: {callout_msg}")
+                        #         except Exception as e:
+                        #             logger.warning(f"Failed to post viewer callout: {e}")
+                        
+
                     
-                    # Check for viewer callout (excluding admins) - SUPPRESSED
-                    # if self.growth.should_do_viewer_callout(callout_interval_minutes=30):
-                    #     callout_msg = self.growth.get_active_viewer_callout(admin_users=self.admin_users)
-                    #     if callout_msg:
-                    #         try:
-                    #             msg_id = self.youtube.post_message(callout_msg)
-                    #             if msg_id:
-                    #                 self.processed_messages.add(msg_id)
-                    #                 self.save_message_id(msg_id)
-                    #                 self.recent_bot_messages.append(self._normalize_text(callout_msg))
-                    #                 logger.info(f"[VIEWER CALLOUT]: {callout_msg}")
-                    #         except Exception as e:
-                    #             logger.warning(f"Failed to post viewer callout: {e}")
+                    # Periodic announcement (every 7 minutes + at least 10 messages in chat)
+                    if current_time - self.last_announcement_time >= self.announcement_interval:
+                        # Only announce if there's been chat activity (at least 10 messages)
+                        if self.messages_since_last_announcement >= self.min_messages_for_announcement:
+                            self.last_announcement_time = current_time
+                            self.messages_since_last_announcement = 0  # Reset counter
+                            announcement_msg = f"Hey everyone {self.bot_name} is here in the chat ask me anything by tagging me with @{self.bot_name}"
+                            try:
+                                msg_id = self.youtube.post_message(announcement_msg)
+                                if msg_id:
+                                    self.processed_messages.add(msg_id)
+                                    self.save_message_id(msg_id)
+                                    self.recent_bot_messages.append(self._normalize_text(announcement_msg))
+                                    logger.info(f"[PERIODIC ANNOUNCEMENT]: {announcement_msg} (after {self.messages_since_last_announcement} messages)")
+                            except Exception as e:
+                                logger.warning(f"Failed to post periodic announcement: {e}")
+                        else:
+                            logger.debug(f"[PERIODIC ANNOUNCEMENT SKIPPED]: Only {self.messages_since_last_announcement} messages since last announcement (need {self.min_messages_for_announcement})")
                     
-
-                
-                # Periodic announcement (every 7 minutes + at least 10 messages in chat)
-                if current_time - self.last_announcement_time >= self.announcement_interval:
-                    # Only announce if there's been chat activity (at least 10 messages)
-                    if self.messages_since_last_announcement >= self.min_messages_for_announcement:
-                        self.last_announcement_time = current_time
-                        self.messages_since_last_announcement = 0  # Reset counter
-                        announcement_msg = f"Hey everyone {self.bot_name} is here in the chat ask me anything by tagging me with @{self.bot_name}"
+                    # Fetch new messages using pytchat
+                    for c in chat.get().sync_items():
+                        # Convert pytchat message to our format
+                        msg_data = {
+                            'id': c.id,
+                            'author': c.author.name,
+                            'author_channel_id': c.author.channelId,
+                            'message': c.message,
+                            'timestamp': c.datetime,
+                            'is_moderator': c.author.isChatModerator,
+                            'is_owner': c.author.isChatOwner,
+                            'type': 'text'  # pytchat only provides text messages
+                        }
+                        await self.process_message(msg_data)
+                    
+                    # Track viewer count periodically
+                    if current_time - self.last_viewer_snapshot >= self.viewer_snapshot_interval:
                         try:
-                            msg_id = self.youtube.post_message(announcement_msg)
-                            if msg_id:
-                                self.processed_messages.add(msg_id)
-                                self.save_message_id(msg_id)
-                                self.recent_bot_messages.append(self._normalize_text(announcement_msg))
-                                logger.info(f"[PERIODIC ANNOUNCEMENT]: {announcement_msg} (after {self.messages_since_last_announcement} messages)")
+                            stats = self.youtube.get_stream_stats()
+                            if stats:
+                                self.stream_stats = stats
+                                self.analytics.track_viewer_count(
+                                    stats.get('viewer_count', 0),
+                                    stats.get('likes', 0)
+                                )
+                                # Update growth features with current subscriber count
+                                subscriber_count = stats.get('subs', 0)
+                                if subscriber_count > 0:
+                                    self.growth.update_subscriber_count(subscriber_count)
+                                self.last_viewer_snapshot = current_time
                         except Exception as e:
-                            logger.warning(f"Failed to post periodic announcement: {e}")
-                    else:
-                        logger.debug(f"[PERIODIC ANNOUNCEMENT SKIPPED]: Only {self.messages_since_last_announcement} messages since last announcement (need {self.min_messages_for_announcement})")
-                
-                # Fetch new messages using pytchat
-                for c in chat.get().sync_items():
-                    # Convert pytchat message to our format
-                    msg_data = {
-                        'id': c.id,
-                        'author': c.author.name,
-                        'author_channel_id': c.author.channelId,
-                        'message': c.message,
-                        'timestamp': c.datetime,
-                        'is_moderator': c.author.isChatModerator,
-                        'is_owner': c.author.isChatOwner,
-                        'type': 'text'  # pytchat only provides text messages
-                    }
-                    await self.process_message(msg_data)
-                
-                # Track viewer count periodically
-                if current_time - self.last_viewer_snapshot >= self.viewer_snapshot_interval:
-                    try:
-                        stats = self.youtube.get_stream_stats()
-                        if stats:
-                            self.analytics.track_viewer_count(
-                                stats.get('viewer_count', 0),
-                                stats.get('likes', 0)
-                            )
-                            # Update growth features with current subscriber count
-                            subscriber_count = stats.get('subs', 0)
-                            if subscriber_count > 0:
-                                self.growth.update_subscriber_count(subscriber_count)
-                            self.last_viewer_snapshot = current_time
-                    except Exception as e:
-                        logger.error(f"Error tracking viewer count: {e}")
-                
-                # Wait a bit before checking again
-                await asyncio.sleep(1.0)
-            except KeyboardInterrupt:
-                logger.info("Keyboard interrupt - stopping chat bridge...")
-                self.is_running = False
-                break
-            except Exception as e:
-                logger.error(f"Error in chat bridge loop: {e}")
-                await asyncio.sleep(5)
-        
-        # Cancel the intro task
-        if 'intro_task' in locals():
-            intro_task.cancel()
-            try:
-                await intro_task
-            except asyncio.CancelledError:
-                pass
-        
-        # Note: stats_task removed as part of quota optimization - use !stats command instead
-        
-        # End analytics session when stopping
-        self.analytics.end_session()
-        logger.info("Analytics session ended")
-        logger.info("Bot shutdown complete")
+                            logger.error(f"Error tracking viewer count: {e}")
+                    
+                    # Daily database maintenance, off the event loop
+                    if current_time - self.last_db_maintenance >= self.db_maintenance_interval:
+                        self.last_db_maintenance = current_time
+                        await asyncio.to_thread(self.analytics.db.maintenance)
+                    
+                    # Monthly archiving of old messages, at startup and when
+                    # the month changes
+                    archive_month = time.strftime("%Y-%m")
+                    if archive_month != self.last_archive_month:
+                        self.last_archive_month = archive_month
+                        await asyncio.to_thread(self.analytics.db.archive_old_messages)
+                    
+                    # Wait a bit before checking again
+                    await asyncio.sleep(1.0)
+                except KeyboardInterrupt:
+                    logger.info("Keyboard interrupt - stopping chat bridge...")
+                    self.is_running = False
+                    break
+                except Exception as e:
+                    logger.error(f"Error in chat bridge loop: {e}")
+                    await asyncio.sleep(5)
+        finally:
+            # Cancel the intro task
+            if 'intro_task' in locals():
+                intro_task.cancel()
+                try:
+                    await intro_task
+                except asyncio.CancelledError:
+                    pass
+            
+            # Note: stats_task removed as part of quota optimization - use !stats command instead
+            
+            # End analytics session when stopping, then close the tracker: it
+            # drains queued writes and closes the database, which checkpoints
+            # the WAL into analytics.db (the workflow only commits the main file)
+            # and runs PRAGMA optimize, so no full ANALYZE is needed here
+            self.analytics.end_session()
+            self.analytics.close()
+            logger.info("Analytics session ended")
+            self.growth.flush()
+            logger.info("Bot shutdown complete")
     
     async def process_message(self, message: dict):
         """
@@ -584,7 +611,7 @@ class YouTubeChatBridge:
         is_command = text.startswith("!")
         command_name = None
         if is_command and " " in text:
-            command_name = text.split()[0][1:]  # Remove ! and get command name
+            command_name = text.split(None, 1)[0][1:]  # Remove ! and get command name
         elif is_command:
             command_name = text[1:]  # Just the command without !
         
@@ -600,9 +627,11 @@ class YouTubeChatBridge:
         # 1. First, try to get a quick response from a skill
         context = {
             "streamer_profile": self.streamer_profile,
+            "streamer_name": self.streamer_name,
             "current_game": self.current_game,
             "stream_topic": self.stream_topic,
             "youtube_api": self.youtube,
+            "stream_stats": self.stream_stats,
         }
 
         # Viewer count check disabled for testing
@@ -612,7 +641,7 @@ class YouTubeChatBridge:
         command_start_time = time.time()
         command_success = False
         
-        if text.startswith("!"):
+        if is_command:
             if self.command_parser.can_handle(text):
                 logger.debug(f"Handling command from {author}: {text[:40]}...")
                 cmd_context = CommandContext(
@@ -637,11 +666,11 @@ class YouTubeChatBridge:
                     self.analytics.track_command_execution(command_name, command_success, command_time)
 
         # 2. If not a command, try skills
-        if not response and not text.startswith("!"):
+        if not response and not is_command:
             response = await self.skills.dispatch(author, text, context)
 
         # 3. If no skill handled it, check if the agent should respond
-        if not response and not text.startswith("!"):
+        if not response and not is_command:
             should_respond = self.should_respond_to_message(text)
             if should_respond:
                 enable_agent = os.getenv("ENABLE_AGENT", "true").strip().lower()
@@ -673,7 +702,7 @@ class YouTubeChatBridge:
             await asyncio.sleep(self.response_delay)
             
             # Check if this is a returning viewer with historical data
-            is_returning = self.growth.is_returning_viewer(author)
+            is_returning = self.analytics.is_returning_viewer(author)
             
             if not is_returning:
                 # Only greet completely new viewers with generic message